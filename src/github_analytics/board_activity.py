@@ -23,6 +23,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import polars as pl
 from dotenv import load_dotenv
 from rich.console import Console
@@ -618,7 +619,7 @@ def check_pr_activity_for_user(
             timeout=30,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "errors" in data:
             return False
@@ -21,7 +21,7 @@ def load_board_items() -> list[dict]:
     path = CACHE_DIR / "board_items.json"
     if not path.exists():
         raise FileNotFoundError(f"Board items cache not found: {path}")
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
@@ -59,7 +59,7 @@ def format_item_for_summary(item: dict) -> str:
     activity = item.get("recent_activity", [])
     if activity:
         lines.append("Recent Activity:")
-        for act in activity[:5]:
+        for act in activity:
             author = act.get("author", "?")
             act_type = act.get("type", "?")
             date = act.get("date", "?")
@@ -14,7 +14,7 @@ CACHE_DIR = Path("cache/board_summary")
 
 def load_board_items() -> list[dict]:
     path = CACHE_DIR / "board_items.json"
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
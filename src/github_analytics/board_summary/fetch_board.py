@@ -1,15 +1,39 @@
 """Fetch and enrich board items from GitHub project board."""
 
 import json
+import shutil
 import subprocess
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cache, lru_cache, wraps
 from pathlib import Path
 
+import orjson
+
 # Default configuration
 DEFAULT_ORG = "probabl-ai"
 DEFAULT_PROJECT = 8
 CACHE_DIR = Path("cache/board_summary")
+# Consumers of the cache read recent_activity as-is, so cap it when writing.
+RECENT_ACTIVITY_LIMIT = 5
+# PR/issue details fetched within this window are reused from disk
+DETAILS_CACHE_DIR = CACHE_DIR / "details"
+DETAILS_TTL_SECONDS = 60 * 60
+# The caches are only read back by these scripts; flip to pretty-print them.
+HUMAN_READABLE = False
+
+
+def dump_json(obj, default=None) -> bytes:
+    """Serialize a cache file: compact, or indented when HUMAN_READABLE."""
+    option = orjson.OPT_INDENT_2 if HUMAN_READABLE else None
+    return orjson.dumps(obj, default=default, option=option)
+
+
+@cache
+def short_repo_name(repo: str) -> str:
+    """Return the repo name without its owner ("owner/name" -> "name")."""
+    return repo[repo.rfind("/") + 1 :]
 
 
 def fetch_board_items(
@@ -55,7 +79,7 @@ def fetch_board_items(
         items.append(
             {
                 "repo": repo,
-                "repo_short": repo.split("/")[-1] if "/" in repo else repo,
+                "repo_short": short_repo_name(repo),
                 "number": content.get("number", 0),
                 "title": content.get("title", ""),
                 "type": content.get("type", ""),
@@ -72,6 +96,60 @@ def fetch_board_items(
     return items
 
 
+def _details_cache_path(kind: str, repo: str, number: int) -> Path:
+    return DETAILS_CACHE_DIR / f"{kind}_{repo.replace('/', '__')}_{number}.json"
+
+
+def load_cached_details(kind: str, repo: str, number: int) -> dict | None:
+    """Return details cached on disk within DETAILS_TTL_SECONDS, else None."""
+    path = _details_cache_path(kind, repo, number)
+    try:
+        if time.time() - path.stat().st_mtime < DETAILS_TTL_SECONDS:
+            return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        pass
+    return None
+
+
+def save_cached_details(kind: str, repo: str, number: int, details: dict):
+    """Write fetched details to the disk cache."""
+    DETAILS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _details_cache_path(kind, repo, number).write_text(json.dumps(details))
+
+
+def cache_details(kind: str):
+    """Cache a details fetcher per (repo, number), in memory and on disk.
+
+    Only successful fetches are written to disk, so a failed lookup is
+    retried on the next run.
+    """
+
+    def decorator(fetch):
+        @lru_cache(maxsize=4096)
+        @wraps(fetch)
+        def wrapper(repo: str, number: int) -> dict | None:
+            details = load_cached_details(kind, repo, number)
+            if details is not None:
+                return details
+
+            details = fetch(repo, number)
+            if details is not None:
+                save_cached_details(kind, repo, number, details)
+            return details
+
+        return wrapper
+
+    return decorator
+
+
+def clear_details_cache():
+    """Drop cached PR/issue details so the next fetches hit GitHub."""
+    shutil.rmtree(DETAILS_CACHE_DIR, ignore_errors=True)
+    fetch_pr_details.cache_clear()
+    fetch_issue_details.cache_clear()
+
+
+@cache_details("pr")
 def fetch_pr_details(repo: str, number: int) -> dict | None:
     """Fetch PR details using gh CLI."""
     try:
@@ -97,6 +175,7 @@ def fetch_pr_details(repo: str, number: int) -> dict | None:
     return None
 
 
+@cache_details("issue")
 def fetch_issue_details(repo: str, number: int) -> dict | None:
     """Fetch issue details using gh CLI."""
     try:
@@ -286,7 +365,7 @@ def get_recent_activity(details: dict | None) -> list[dict]:
         )
 
     activities.sort(key=lambda x: x["date"], reverse=True)
-    return activities[:5]
+    return activities[:RECENT_ACTIVITY_LIMIT]
 
 
 def enrich_item(item: dict, all_users: set[str]) -> dict:
@@ -387,14 +466,12 @@ def save_to_cache(items: list[dict], filename: str = "board_items.json") -> Path
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     path = CACHE_DIR / filename
-    with open(path, "w") as f:
-        json.dump(items, f, indent=2)
+    data = dump_json(items)
+    path.write_bytes(data)
 
     # Also save original copy for merge_activity to use
     if filename == "board_items.json":
-        original_path = CACHE_DIR / "board_items_original.json"
-        with open(original_path, "w") as f:
-            json.dump(items, f, indent=2)
+        (CACHE_DIR / "board_items_original.json").write_bytes(data)
 
     return path
 
@@ -403,7 +480,7 @@ def load_from_cache(filename: str = "board_items.json") -> list[dict] | None:
     """Load items from cache file if it exists."""
     path = CACHE_DIR / filename
     if path.exists():
-        with open(path) as f:
+        with open(path, encoding="utf-8") as f:
             return json.load(f)
     return None
 
@@ -49,34 +49,46 @@ def wait_for_rate_limit(resource: str = "search"):
             time.sleep(wait_seconds)
 
 
-def run_graphql_query(query: str) -> dict | None:
-    """Run a GraphQL query using gh api."""
+def _parse_graphql_output(result, allow_partial: bool) -> dict | None:
+    """Parse gh api output, keeping partial data if allow_partial is set."""
+    if result.returncode != 0 and not allow_partial:
+        return None
+    try:
+        parsed = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return None
+    # gh exits non-zero when the response has "errors", but still prints it
+    if result.returncode != 0 and not parsed.get("data"):
+        return None
+    return parsed
+
+
+def run_graphql_query(query: str, allow_partial: bool = False) -> dict | None:
+    """Run a GraphQL query using gh api.
+
+    With allow_partial, a response that has "errors" next to its "data" (e.g.
+    one aliased item was not found) is returned instead of None.
+    """
     result = subprocess.run(
         ["gh", "api", "graphql", "-f", f"query={query}"],
         capture_output=True,
         text=True,
         timeout=60,
     )
-    if result.returncode == 0:
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return None
-    else:
-        # Check if it's a rate limit error
-        if "rate limit" in result.stderr.lower():
-            print("  Rate limit hit, waiting...")
-            wait_for_rate_limit("graphql")
-            # Retry once
-            result = subprocess.run(
-                ["gh", "api", "graphql", "-f", f"query={query}"],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-    return None
+    parsed = _parse_graphql_output(result, allow_partial)
+    # Check if it's a rate limit error
+    if parsed is None and "rate limit" in result.stderr.lower():
+        print("  Rate limit hit, waiting...")
+        wait_for_rate_limit("graphql")
+        # Retry once
+        result = subprocess.run(
+            ["gh", "api", "graphql", "-f", f"query={query}"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        parsed = _parse_graphql_output(result, allow_partial)
+    return parsed
 
 
 def fetch_user_activity_graphql(
@@ -23,15 +23,19 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 from fetch_board import (
+    clear_details_cache,
     enrich_board_items,
     fetch_board_items,
     get_all_users,
-    load_from_cache,
     save_to_cache,
 )
 from generate_report import save_report
 from import_summaries import import_summaries
-from merge_activity import INCLUDED_REPOS, merge_activity_with_board
+from merge_activity import (
+    INCLUDED_REPOS,
+    load_board_items,
+    merge_activity_with_board,
+)
 
 # Load environment variables
 load_dotenv()
@@ -65,6 +69,7 @@ def generate_all_reports(
     output_dir: str = "reports",
     skip_fetch: bool = False,
     skip_ai: bool = False,
+    refresh: bool = False,
 ) -> dict[str, Path]:
     """Generate board summary reports.
 
@@ -74,21 +79,23 @@ def generate_all_reports(
         output_dir: Directory for output reports.
         skip_fetch: If True, use cached data instead of fetching.
         skip_ai: If True, skip AI summary generation.
+        refresh: If True, refetch GitHub data instead of reusing recent caches.
 
     Returns:
         Dictionary mapping report type to file path.
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if refresh:
+        clear_details_cache()
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Step 1: Fetch and enrich board items
     if skip_fetch and (CACHE_DIR / "board_items.json").exists():
         print("Using cached board items...")
-        enriched_items = load_from_cache()
-        board_only_items = [
-            i for i in enriched_items if i.get("board_status") != "Not Included"
-        ]
+        # Board-only items (before merge) for user detection; fetch_board
+        # keeps them in board_items_original.json, so nothing to filter
+        board_only_items = load_board_items()
     else:
         print("=" * 50)
         print("Step 1: Fetching board items")
@@ -114,7 +121,7 @@ def generate_all_reports(
         print(f"Lookback: {lookback_days} days")
         print(f"Included repos: {', '.join(INCLUDED_REPOS)}")
         print()
-        merge_activity_with_board(users, lookback_days=lookback_days)
+        merge_activity_with_board(users, lookback_days=lookback_days, refresh=refresh)
 
     # Step 3: Generate AI summaries
     if not skip_ai:
@@ -196,6 +203,11 @@ def main():
         action="store_true",
         help="Use cached data instead of fetching fresh data",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore recently cached GitHub data and refetch it",
+    )
     parser.add_argument(
         "--skip-ai",
         action="store_true",
@@ -212,6 +224,7 @@ def main():
         output_dir=args.output,
         skip_fetch=args.skip_fetch,
         skip_ai=args.skip_ai,
+        refresh=args.refresh,
     )
 
 
@@ -17,9 +17,13 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from fetch_board import dump_json
+
 CACHE_DIR = Path("cache/board_summary")
 SUMMARIES_FILE = Path(__file__).parent / "summaries.json"
 
@@ -29,22 +33,35 @@ def load_board_items() -> list[dict]:
     path = CACHE_DIR / "board_items.json"
     if not path.exists():
         raise FileNotFoundError(f"Board items cache not found: {path}")
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
-def load_existing_summaries() -> dict:
-    """Load existing summaries from file."""
+@lru_cache(maxsize=1)
+def _read_summaries_file() -> dict:
+    """Parse the summaries file; cleared by save_summaries."""
     if SUMMARIES_FILE.exists():
-        with open(SUMMARIES_FILE) as f:
+        with open(SUMMARIES_FILE, encoding="utf-8") as f:
             return json.load(f)
     return {}
 
 
+def load_existing_summaries() -> dict:
+    """Load existing summaries from file.
+
+    The file is parsed once per process until the next save; callers get a
+    shallow copy they are free to update.
+    """
+    return dict(_read_summaries_file())
+
+
 def save_summaries(summaries: dict):
-    """Save summaries to file."""
-    with open(SUMMARIES_FILE, "w") as f:
-        json.dump(summaries, f, indent=2)
+    """Save summaries to file atomically."""
+    tmp_path = SUMMARIES_FILE.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(dump_json(summaries))
+    os.replace(tmp_path, SUMMARIES_FILE)
+    _read_summaries_file.cache_clear()
 
 
 def get_item_id(item: dict) -> str:
@@ -59,6 +76,10 @@ def list_items_needing_summaries(max_items: int = 50) -> list[dict]:
 
     needs_summary = []
     for item in items:
+        # Stop once enough items are collected instead of building the rest
+        if len(needs_summary) >= max_items:
+            break
+
         item_id = get_item_id(item)
         item_updated = item.get("updated_at", "")
 
@@ -88,7 +109,7 @@ def list_items_needing_summaries(max_items: int = 50) -> list[dict]:
                 "reviewer2": item.get("reviewer2", ""),
                 "updated_at": item.get("updated_at", ""),
                 "created_at": item.get("created_at", ""),
-                "recent_activity": item.get("recent_activity", [])[:5],
+                "recent_activity": item.get("recent_activity", []),
             }
 
             # Include linked PRs for issues - important context for summaries
@@ -99,7 +120,7 @@ def list_items_needing_summaries(max_items: int = 50) -> list[dict]:
 
             needs_summary.append(item_data)
 
-    return needs_summary[:max_items]
+    return needs_summary
 
 
 def import_summaries_from_stdin():
@@ -5,7 +5,7 @@ This script generates summaries for items that don't have them yet,
 using the Anthropic Claude API.
 
 Usage:
-    python generate_summaries_api.py [--max N] [--model MODEL]
+    python generate_summaries_api.py [--max N] [--model MODEL] [--workers N]
 
 Environment variables:
     ANTHROPIC_API_KEY: Required. Your Anthropic API key.
@@ -13,9 +13,9 @@ Environment variables:
 """
 
 import argparse
-import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 import anthropic
@@ -29,11 +29,24 @@ from generate_summaries import (
 # Load environment variables from .env file if it exists
 load_dotenv()
 
+AI_STATUSES = (
+    "Merged",
+    "Ready to merge",
+    "Needs second review or ready to merge",
+    "Needs minor work",
+    "In progress",
+    "Blocked",
+    "Needs review",
+    "Stale",
+    "Needs discussion",
+    "Waiting for author",
+)
+
 # System prompt for generating summaries
 SYSTEM_PROMPT = """\
 You are an assistant helping to analyze GitHub pull requests and issues.
 
-For each item, generate a JSON object with these fields:
+For each item, call the emit_summary tool with these fields:
 - summary: A 1-2 sentence description of the item and its current status
 - ai_status: One of the status values listed below
 - action_items: A list of 0-3 specific next steps needed
@@ -55,9 +68,38 @@ Status definitions:
 - Needs review: Waiting for reviewer feedback
 - Stale: No activity for extended period
 - Needs discussion: Design or approach needs team input
-- Waiting for author: Reviewer has given feedback, waiting for author
+- Waiting for author: Reviewer has given feedback, waiting for author"""
+
+# The summary is returned as the input of a forced tool call, so the API
+# hands back an already-parsed dict that follows this schema
+SUMMARY_TOOL = {
+    "name": "emit_summary",
+    "description": "Record the summary of a GitHub item.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "ai_status": {"type": "string", "enum": list(AI_STATUSES)},
+            "action_items": {"type": "array", "items": {"type": "string"}},
+            "action_required_by": {"type": "array", "items": {"type": "string"}},
+            "action_reason": {"type": "string"},
+        },
+        "required": [
+            "summary",
+            "ai_status",
+            "action_items",
+            "action_required_by",
+            "action_reason",
+        ],
+    },
+}
 
-Respond with ONLY valid JSON, no markdown formatting or explanation."""
+# System prompt as a cacheable content block. The prefix (tools plus system) is
+# only cached once it passes the model's minimum cacheable length; below that
+# the cache_control marker is ignored and every request pays for it in full
+SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+]
 
 
 def generate_summary_for_item(
@@ -65,34 +107,38 @@ def generate_summary_for_item(
 ) -> dict:
     """Generate a summary for a single item using the Anthropic API."""
     # Build the prompt with item details
-    item_info = f"""
-Item: {item["id"]}
-Title: {item["title"]}
-Type: {item["type"]}
-URL: {item["url"]}
-Author: {item["author"]}
-State: {item["state"]}
-Board Status: {item["board_status"]}
-Computed Status: {item["computed_status"]}
-Champion: {item.get("champion", "None")}
-Reviewer 1: {item.get("reviewer1", "None")}
-Reviewer 2: {item.get("reviewer2", "None")}
-Created: {item["created_at"]}
-Updated: {item["updated_at"]}
-
-Recent Activity:
-"""
-    for activity in item.get("recent_activity", [])[:5]:
-        date = activity["date"]
-        atype = activity["type"]
-        author = activity["author"]
-        summary = activity.get("summary", "")[:200]
-        item_info += f"- {date} | {atype} by {author}: {summary}\n"
+    lines = [
+        "",
+        f"Item: {item['id']}",
+        f"Title: {item['title']}",
+        f"Type: {item['type']}",
+        f"URL: {item['url']}",
+        f"Author: {item['author']}",
+        f"State: {item['state']}",
+        f"Board Status: {item['board_status']}",
+        f"Computed Status: {item['computed_status']}",
+        f"Champion: {item.get('champion', 'None')}",
+        f"Reviewer 1: {item.get('reviewer1', 'None')}",
+        f"Reviewer 2: {item.get('reviewer2', 'None')}",
+        f"Created: {item['created_at']}",
+        f"Updated: {item['updated_at']}",
+        "",
+        "Recent Activity:",
+    ]
+    lines.extend(
+        f"- {activity['date']} | {activity['type']} by {activity['author']}: "
+        f"{activity.get('summary', '')[:200]}"
+        for activity in item.get("recent_activity", [])
+    )
+    lines.append("")
+    item_info = "\n".join(lines)
 
     message = client.messages.create(
         model=model,
         max_tokens=500,
-        system=SYSTEM_PROMPT,
+        system=SYSTEM_BLOCKS,
+        tools=[SUMMARY_TOOL],
+        tool_choice={"type": "tool", "name": SUMMARY_TOOL["name"]},
         messages=[
             {
                 "role": "user",
@@ -101,46 +147,39 @@ Recent Activity:
         ],
     )
 
-    # Parse the response
-    response_text = message.content[0].text.strip()
-
-    # Try to parse as JSON
-    try:
-        # Handle potential markdown code blocks
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            response_text = "\n".join(lines[1:-1])
-
-        summary = json.loads(response_text)
-
-        # Validate required fields
-        required_fields = [
-            "summary",
-            "ai_status",
-            "action_items",
-            "action_required_by",
-            "action_reason",
-        ]
-        for field in required_fields:
-            if field not in summary:
-                summary[field] = (
-                    "" if field in ["summary", "ai_status", "action_reason"] else []
-                )
-
-        return summary
-    except json.JSONDecodeError as e:
-        print(f"Warning: Failed to parse JSON for {item['id']}: {e}", file=sys.stderr)
+    for block in message.content:
+        if block.type == "tool_use":
+            summary = dict(block.input)
+            break
+    else:
+        print(
+            f"Warning: No summary returned for {item['id']} "
+            f"(stop reason: {message.stop_reason})",
+            file=sys.stderr,
+        )
         return {
-            "summary": response_text[:200],
+            "summary": "",
             "ai_status": "In progress",
             "action_items": [],
             "action_required_by": [],
-            "action_reason": "Failed to parse AI response",
+            "action_reason": "No summary in AI response",
         }
 
+    # A response cut off by max_tokens can still miss fields
+    for field in ["summary", "ai_status", "action_reason"]:
+        summary.setdefault(field, "")
+    for field in ["action_items", "action_required_by"]:
+        summary.setdefault(field, [])
+
+    return summary
+
 
-def generate_summaries(max_items: int = 50, model: str = "claude-sonnet-4-20250514"):
-    """Generate summaries for items that need them."""
+def generate_summaries(
+    max_items: int = 50,
+    model: str = "claude-sonnet-4-20250514",
+    max_workers: int = 8,
+):
+    """Generate summaries for items that need them using parallel requests."""
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -157,24 +196,35 @@ def generate_summaries(max_items: int = 50, model: str = "claude-sonnet-4-202505
         print("All items already have summaries!")
         return
 
-    print(f"Generating summaries for {len(items)} items using {model}...")
+    print(
+        f"Generating summaries for {len(items)} items using {model} "
+        f"with {max_workers} workers..."
+    )
 
     # Load existing summaries
     existing = load_existing_summaries()
     new_summaries = {}
 
-    for i, item in enumerate(items):
-        item_id = item["id"]
-        print(f"  [{i + 1}/{len(items)}] {item_id}: {item['title'][:50]}...")
+    # Each item is an independent API round-trip, so run them concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(generate_summary_for_item, client, item, model): item
+            for item in items
+        }
+
+        for i, future in enumerate(as_completed(futures)):
+            item = futures[future]
+            item_id = item["id"]
+            print(f"  [{i + 1}/{len(items)}] {item_id}: {item['title'][:50]}...")
 
-        try:
-            summary = generate_summary_for_item(client, item, model)
-            # Add timestamp for staleness checking
-            summary["generated_at"] = datetime.now().strftime("%Y-%m-%d")
-            new_summaries[item_id] = summary
-            print(f"    -> {summary['ai_status']}")
-        except Exception as e:
-            print(f"    -> Error: {e}", file=sys.stderr)
+            try:
+                summary = future.result()
+                # Add timestamp for staleness checking
+                summary["generated_at"] = datetime.now().strftime("%Y-%m-%d")
+                new_summaries[item_id] = summary
+                print(f"    -> {summary['ai_status']}")
+            except Exception as e:
+                print(f"    -> Error: {e}", file=sys.stderr)
 
     # Save all summaries
     existing.update(new_summaries)
@@ -200,9 +250,15 @@ def main():
         default="claude-sonnet-4-20250514",
         help="Anthropic model to use (default: claude-sonnet-4-20250514)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of concurrent API requests (default: 8)",
+    )
 
     args = parser.parse_args()
-    generate_summaries(max_items=args.max, model=args.model)
+    generate_summaries(max_items=args.max, model=args.model, max_workers=args.workers)
 
 
 if __name__ == "__main__":
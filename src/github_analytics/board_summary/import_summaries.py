@@ -13,6 +13,8 @@ import json
 import sys
 from pathlib import Path
 
+from fetch_board import dump_json
+
 CACHE_DIR = Path("cache/board_summary")
 
 
@@ -21,15 +23,15 @@ def load_board_items() -> list[dict]:
     path = CACHE_DIR / "board_items.json"
     if not path.exists():
         raise FileNotFoundError(f"Board items cache not found: {path}")
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_board_items(items: list[dict]):
     """Save board items to cache."""
     path = CACHE_DIR / "board_items.json"
-    with open(path, "w") as f:
-        json.dump(items, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(dump_json(items))
 
 
 def load_summaries(summaries_path: str) -> dict[str, dict | str]:
@@ -39,7 +41,7 @@ def load_summaries(summaries_path: str) -> dict[str, dict | str]:
     - Simple strings (old format)
     - Objects with summary, ai_status, action_items (new format)
     """
-    with open(summaries_path) as f:
+    with open(summaries_path, encoding="utf-8") as f:
         return json.load(f)
 
 
@@ -51,29 +53,38 @@ def import_summaries(summaries_path: str = "summaries.json"):
     items = load_board_items()
     summaries = load_summaries(summaries_path)
 
+    # Index items by id once, then walk the summaries against the index
+    items_by_id: dict[str, list[dict]] = {}
+    for item in items:
+        item_id = f"{item.get('repo_short', '')}#{item.get('number', '')}"
+        items_by_id.setdefault(item_id, []).append(item)
+
     matched = 0
-    unmatched = []
+    extra = []
 
-    for item in items:
-        repo = item.get("repo_short", "")
-        number = item.get("number", "")
-        item_id = f"{repo}#{number}"
-
-        if item_id in summaries:
-            summary_data = summaries[item_id]
-            if isinstance(summary_data, str):
-                # Old format: just a string summary
-                item["summary"] = summary_data
-            else:
-                # New format: object with summary, ai_status, action_items, etc.
-                item["summary"] = summary_data.get("summary", "")
-                item["ai_status"] = summary_data.get("ai_status", "")
-                item["action_items"] = summary_data.get("action_items", [])
-                item["action_required_by"] = summary_data.get("action_required_by", [])
-                item["action_reason"] = summary_data.get("action_reason", "")
-            matched += 1
+    for item_id, summary_data in summaries.items():
+        matching = items_by_id.get(item_id)
+        if not matching:
+            extra.append(item_id)
+            continue
+
+        if isinstance(summary_data, str):
+            # Old format: just a string summary
+            fields = {"summary": summary_data}
         else:
-            unmatched.append(item_id)
+            # New format: object with summary, ai_status, action_items, etc.
+            fields = {
+                "summary": summary_data.get("summary", ""),
+                "ai_status": summary_data.get("ai_status", ""),
+                "action_items": summary_data.get("action_items", []),
+                "action_required_by": summary_data.get("action_required_by", []),
+                "action_reason": summary_data.get("action_reason", ""),
+            }
+        for item in matching:
+            item.update(fields)
+        matched += len(matching)
+
+    unmatched = [item_id for item_id in items_by_id if item_id not in summaries]
 
     save_board_items(items)
 
@@ -85,9 +96,7 @@ def import_summaries(summaries_path: str = "summaries.json"):
         if len(unmatched) > 10:
             print(f"  ... and {len(unmatched) - 10} more")
 
-    # Check for summaries that didn't match any item
-    item_ids = {f"{i.get('repo_short', '')}#{i.get('number', '')}" for i in items}
-    extra = [s for s in summaries if s not in item_ids]
+    # Summaries that didn't match any item
     if extra:
         print(f"\nSummaries that didn't match any item ({len(extra)}):")
         for s in extra[:5]:
@@ -5,63 +5,144 @@ and adds items not already on the board to the board_items.json cache.
 """
 
 import json
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
+import orjson
 from fetch_board import (
     CACHE_DIR,
     determine_status,
+    dump_json,
     fetch_issue_details,
     fetch_pr_details,
     get_recent_activity,
+    load_cached_details,
+    save_cached_details,
+    short_repo_name,
+)
+from fetch_user_activity import (
+    DEFAULT_REPOS,
+    fetch_all_users_activity,
+    run_graphql_query,
+    wait_for_rate_limit,
 )
-from fetch_user_activity import DEFAULT_REPOS, fetch_all_users_activity
 
 # Repos to include in the main view (configurable)
 # Items from these repos will be shown even if not on board
 INCLUDED_REPOS = DEFAULT_REPOS.copy()
 
+# A user_activity.json fetched for the same users, repos and lookback within
+# this window is reused instead of querying GitHub again
+ACTIVITY_TTL_SECONDS = 15 * 60
+ACTIVITY_META_FILE = CACHE_DIR / "user_activity_meta.json"
+
+# (activity field, item type, interaction) for each kind of user activity.
+# Issue comments can be on issues or PRs; enrichment settles the type.
+ACTIVITY_KINDS = (
+    ("authored_prs", "PullRequest", "authored"),
+    ("reviewed_prs", "PullRequest", "reviewed"),
+    ("issue_comments", "Issue", "commented"),
+)
+
 
 def load_board_items() -> list[dict]:
     """Load original board items from cache (not merged)."""
     # First try board_items_original.json (pure board items)
     path = CACHE_DIR / "board_items_original.json"
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     # Fall back to board_items.json for backwards compatibility
     path = CACHE_DIR / "board_items.json"
     if path.exists():
-        with open(path) as f:
-            items = json.load(f)
-            # Filter out activity items if this is a merged file
-            return [i for i in items if i.get("board_status") != "Not Included"]
+        items = orjson.loads(path.read_bytes())
+        # Filter out activity items if this is a merged file
+        return [i for i in items if i.get("board_status") != "Not Included"]
     return []
 
 
-def load_user_activity() -> dict[str, dict]:
-    """Load user activity from cache."""
+def load_user_activity(users: list[str] | None = None) -> dict[str, dict]:
+    """Load user activity from cache, optionally only for the given users."""
     path = CACHE_DIR / "user_activity.json"
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
+    if not path.exists():
+        return {}
+    activity = orjson.loads(path.read_bytes())
+    if users is None:
+        return activity
+    # Keep only the wanted users so the rest can be freed right away
+    return {user: activity[user] for user in users if user in activity}
+
+
+def _json_default(obj):
+    """Serialize the user sets kept on merged items as sorted JSON lists.
+
+    Set order follows string hashing, which changes between runs; sorting keeps
+    the written bytes stable so unchanged items leave the file untouched.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError
+
+
+def user_activity_is_fresh(meta: dict) -> bool:
+    """Check whether cached user activity was fetched recently with `meta`."""
+    path = CACHE_DIR / "user_activity.json"
+    try:
+        if time.time() - path.stat().st_mtime >= ACTIVITY_TTL_SECONDS:
+            return False
+        return orjson.loads(ACTIVITY_META_FILE.read_bytes()) == meta
+    except (OSError, orjson.JSONDecodeError):
+        return False
 
 
-def save_board_items(items: list[dict]):
-    """Save board items to cache."""
+def save_user_activity(user_activity: dict[str, dict], meta: dict):
+    """Save user activity to cache, with the parameters it was fetched for."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / "user_activity.json", "wb") as f:
+        f.write(dump_json(user_activity))
+    ACTIVITY_META_FILE.write_bytes(orjson.dumps(meta))
+
+
+def save_board_items(items: list[dict]) -> bool:
+    """Save board items to cache.
+
+    The file is left untouched (and keeps its mtime, which the report cache
+    keys on) when its content would not change. Returns whether it was written.
+    """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     path = CACHE_DIR / "board_items.json"
-    with open(path, "w") as f:
-        json.dump(items, f, indent=2)
+    data = dump_json(items, default=_json_default)
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+@lru_cache(maxsize=8)
+def lower_repo_set(repos: tuple[str, ...]) -> frozenset[str]:
+    """Lowercased repo names, for case-insensitive membership checks."""
+    return frozenset(repo.lower() for repo in repos)
 
 
-def get_board_item_keys(items: list[dict]) -> set[tuple[str, int]]:
-    """Get set of (repo, number) tuples for board items."""
-    return {(item["repo"], item["number"]) for item in items}
+_board_item_key = itemgetter("repo", "number")
+
+
+def index_board_items(items: list[dict]) -> dict[tuple[str, int], dict]:
+    """Index board items by (repo, number)."""
+    return dict(zip(map(_board_item_key, items), items))
 
 
 def extract_repo_and_number(item: dict) -> tuple[str, int]:
     """Extract repo and number from an activity item."""
     # Activity items have repository.nameWithOwner format
+    try:
+        return item["repository"]["nameWithOwner"], item["number"]
+    except (KeyError, TypeError):
+        pass
+    # Missing fields, or a plain string repository
     repo_info = item.get("repository", {})
     if isinstance(repo_info, dict):
         repo = repo_info.get("nameWithOwner", "")
@@ -76,15 +157,13 @@ def create_activity_item(
     number: int,
     item_type: str,
     activity_item: dict,
-    involved_users: list[str],
+    involved_users: set[str],
     interaction_types: dict[str, list[str]],
 ) -> dict:
     """Create a board-compatible item from activity data."""
-    repo_short = repo.split("/")[-1] if "/" in repo else repo
-
     return {
         "repo": repo,
-        "repo_short": repo_short,
+        "repo_short": short_repo_name(repo),
         "number": number,
         "title": activity_item.get("title", ""),
         "type": item_type,
@@ -99,12 +178,136 @@ def create_activity_item(
     }
 
 
-def enrich_activity_item(item: dict) -> dict:
-    """Enrich an activity item with details from GitHub."""
+# Fields requested per item by fetch_details_bulk, matching what
+# fetch_pr_details/fetch_issue_details get from the gh CLI
+DETAILS_FIELDS = """
+      __typename
+      ... on PullRequest {
+        title
+        state
+        createdAt
+        updatedAt
+        author { login }
+        comments(last: 10) { nodes { author { login } body createdAt } }
+        reviews(last: 10) { nodes { author { login } state submittedAt } }
+        reviewRequests(first: 20) {
+          nodes { requestedReviewer { ... on User { login } ... on Team { name } } }
+        }
+      }
+      ... on Issue {
+        title
+        state
+        createdAt
+        updatedAt
+        author { login }
+        comments(last: 10) { nodes { author { login } body createdAt } }
+      }
+"""
+
+
+def _details_from_node(node: dict) -> dict:
+    """Convert a GraphQL issueOrPullRequest node to the gh CLI JSON shape."""
+    details = dict(node)
+    details["author"] = node.get("author") or {}
+    for field in ("comments", "reviews"):
+        entries = [n for n in (node.get(field) or {}).get("nodes", []) if n]
+        for entry in entries:
+            entry["author"] = entry.get("author") or {}
+        details[field] = entries
+    details["reviewRequests"] = [
+        n["requestedReviewer"]
+        for n in (node.get("reviewRequests") or {}).get("nodes", [])
+        if n and n.get("requestedReviewer")
+    ]
+    return details
+
+
+# Disk cache kind (see fetch_board.cache_details) for each GraphQL __typename
+DETAILS_KINDS = {"PullRequest": "pr", "Issue": "issue"}
+
+
+def fetch_details_bulk(
+    keys: list[tuple[str, int]], batch_size: int = 50
+) -> dict[tuple[str, int], dict]:
+    """Fetch PR/issue details for many items with batched GraphQL queries.
+
+    Items in the details disk cache are read from it; the rest are aliased up
+    to batch_size per query, grouped by repository, and written back to it.
+    Details are keyed by (repo, number) and carry a "__typename" of
+    "PullRequest" or "Issue"; items that could not be resolved are left out.
+    """
+    details = {}
+    # Items fetched recently by either path are reused from the disk cache
+    missing = []
+    for repo, number in keys:
+        for typename, kind in DETAILS_KINDS.items():
+            cached = load_cached_details(kind, repo, number)
+            if cached is not None:
+                details[(repo, number)] = {**cached, "__typename": typename}
+                break
+        else:
+            missing.append((repo, number))
+
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start : start + batch_size]
+
+        by_repo: dict[str, list[int]] = {}
+        for repo, number in batch:
+            by_repo.setdefault(repo, []).append(number)
+
+        parts = ["query {"]
+        aliases = {}
+        for ri, (repo, numbers) in enumerate(by_repo.items()):
+            owner, name = repo.split("/", 1)
+            parts.append(
+                f"  r{ri}: repository(owner: {json.dumps(owner)}, "
+                f"name: {json.dumps(name)}) {{"
+            )
+            for ni, number in enumerate(numbers):
+                aliases[(f"r{ri}", f"i{ni}")] = (repo, number)
+                parts.append(f"    i{ni}: issueOrPullRequest(number: {number}) {{")
+                parts.append(DETAILS_FIELDS)
+                parts.append("    }")
+            parts.append("  }")
+        parts.append("}")
+
+        wait_for_rate_limit("graphql")
+        try:
+            # A missing item only nulls its own alias; keep the rest of the batch
+            result = run_graphql_query("\n".join(parts), allow_partial=True)
+        except subprocess.TimeoutExpired:
+            # The batch is left to the per-item fetches
+            result = None
+        data = (result or {}).get("data") or {}
+        for (repo_alias, item_alias), (repo, number) in aliases.items():
+            node = (data.get(repo_alias) or {}).get(item_alias)
+            if not node:
+                continue
+            item_details = _details_from_node(node)
+            details[(repo, number)] = item_details
+            kind = DETAILS_KINDS.get(item_details["__typename"])
+            if kind:
+                cached = dict(item_details)
+                del cached["__typename"]
+                save_cached_details(kind, repo, number, cached)
+
+        print(f"  Fetched details for {len(details)}/{len(keys)} activity items")
+
+    return details
+
+
+def enrich_activity_item(item: dict, details: dict | None = None) -> dict:
+    """Enrich an activity item with details from GitHub.
+
+    Details already fetched by fetch_details_bulk can be passed in; otherwise
+    they are fetched for this item alone.
+    """
     repo = item["repo"]
     number = item["number"]
 
-    if item["type"] == "PullRequest":
+    if details is not None:
+        item["type"] = details["__typename"]
+    elif item["type"] == "PullRequest":
         details = fetch_pr_details(repo, number)
     else:
         # Items from issue_comments could be issues OR PRs (PRs are issues in GitHub)
@@ -135,6 +338,8 @@ def merge_activity_with_board(
     users: list[str],
     lookback_days: int = 14,
     included_repos: list[str] | None = None,
+    max_workers: int = 8,
+    refresh: bool = False,
 ) -> list[dict]:
     """Merge user activity with board items.
 
@@ -142,30 +347,42 @@ def merge_activity_with_board(
         users: List of GitHub usernames to fetch activity for
         lookback_days: Number of days to look back for activity
         included_repos: Repos to include in main view (defaults to INCLUDED_REPOS)
+        max_workers: Number of parallel workers for enriching activity items
+        refresh: If True, fetch user activity even if a fresh cache exists
 
     Returns:
         Updated list of board items including activity items
     """
     if included_repos is None:
         included_repos = INCLUDED_REPOS
+    # Drop duplicates (keeping order) so the search filter names each repo once
+    included_repos = list(dict.fromkeys(included_repos))
 
     # Normalize repo names for comparison
-    included_repos_lower = {r.lower() for r in included_repos}
+    included_repos_lower = lower_repo_set(tuple(included_repos))
 
     # Load existing data
     board_items = load_board_items()
-    board_keys = get_board_item_keys(board_items)
+    board_index = index_board_items(board_items)
+    board_keys = board_index.keys()
 
     print(f"Loaded {len(board_items)} board items")
 
-    # Fetch fresh user activity
-    print(f"\nFetching activity for {len(users)} users (last {lookback_days} days)...")
-    user_activity = fetch_all_users_activity(users, included_repos, lookback_days)
-
-    # Save user activity to cache
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_DIR / "user_activity.json", "w") as f:
-        json.dump(user_activity, f, indent=2)
+    # Reuse user activity fetched moments ago for the same query, else fetch it
+    meta = {
+        "users": sorted(users),
+        "repos": sorted(included_repos),
+        "lookback_days": lookback_days,
+    }
+    if not refresh and user_activity_is_fresh(meta):
+        print(f"\nUsing cached activity for {len(users)} users")
+        user_activity = load_user_activity(users)
+    else:
+        print(
+            f"\nFetching activity for {len(users)} users (last {lookback_days} days)..."
+        )
+        user_activity = fetch_all_users_activity(users, included_repos, lookback_days)
+        save_user_activity(user_activity, meta)
 
     # Collect activity items not on board AND activity on board items
     # Track: (repo, number) -> {users who interacted, how they interacted}
@@ -174,97 +391,79 @@ def merge_activity_with_board(
 
     def add_activity(target_dict, key, item_data, item_type, user, interaction):
         """Helper to add activity to a tracking dict."""
-        if key not in target_dict:
-            target_dict[key] = {
+        entry = target_dict.get(key)
+        if entry is None:
+            entry = target_dict[key] = {
                 "item": item_data,
                 "type": item_type,
                 "users": set(),
                 "interactions": {},
             }
-        target_dict[key]["users"].add(user)
-        if user not in target_dict[key]["interactions"]:
-            target_dict[key]["interactions"][user] = []
-        if interaction not in target_dict[key]["interactions"][user]:
-            target_dict[key]["interactions"][user].append(interaction)
-
-    for user, activity in user_activity.items():
-        # Authored PRs
-        for pr in activity.get("authored_prs", []):
-            repo, number = extract_repo_and_number(pr)
-            if not repo or not number:
-                continue
-            if repo.lower() not in included_repos_lower:
-                continue
+        entry["users"].add(user)
+        # Dict as an ordered set: O(1) dedup, first interaction stays first
+        entry["interactions"].setdefault(user, {})[interaction] = None
 
-            key = (repo, number)
-            if key in board_keys:
-                add_activity(board_activity, key, pr, "PullRequest", user, "authored")
-            else:
-                add_activity(activity_items, key, pr, "PullRequest", user, "authored")
+    def interaction_lists(interactions):
+        """Materialize the per-user interaction sets as lists."""
+        return {user: list(kinds) for user, kinds in interactions.items()}
 
-        # Reviewed PRs
-        for pr in activity.get("reviewed_prs", []):
-            repo, number = extract_repo_and_number(pr)
-            if not repo or not number:
-                continue
-            if repo.lower() not in included_repos_lower:
-                continue
-
-            key = (repo, number)
-            if key in board_keys:
-                add_activity(board_activity, key, pr, "PullRequest", user, "reviewed")
-            else:
-                add_activity(activity_items, key, pr, "PullRequest", user, "reviewed")
-
-        # Issue comments (could be issues or PRs)
-        for issue in activity.get("issue_comments", []):
-            repo, number = extract_repo_and_number(issue)
-            if not repo or not number:
-                continue
-            if repo.lower() not in included_repos_lower:
-                continue
-
-            key = (repo, number)
-            if key in board_keys:
-                add_activity(board_activity, key, issue, "Issue", user, "commented")
-            else:
-                add_activity(activity_items, key, issue, "Issue", user, "commented")
+    # Many activity items share a repo; lowercase and check each repo once
+    repo_included: dict[str, bool] = {}
+    for user, activity in user_activity.items():
+        for field, item_type, interaction in ACTIVITY_KINDS:
+            for activity_item in activity.get(field, []):
+                repo, number = extract_repo_and_number(activity_item)
+                if not repo or not number:
+                    continue
+                included = repo_included.get(repo)
+                if included is None:
+                    included = repo_included[repo] = (
+                        repo.lower() in included_repos_lower
+                    )
+                if not included:
+                    continue
+
+                key = (repo, number)
+                target = board_activity if key in board_keys else activity_items
+                add_activity(target, key, activity_item, item_type, user, interaction)
 
     # Update board items with activity information
     for item in board_items:
-        key = (item.get("repo", ""), item.get("number", 0))
-        if key in board_activity:
-            act = board_activity[key]
-            item["involved_users"] = list(act["users"])
-            item["interaction_types"] = act["interactions"]
-        else:
-            # Ensure these fields exist even if no activity
-            if "involved_users" not in item:
-                item["involved_users"] = []
-            if "interaction_types" not in item:
-                item["interaction_types"] = {}
+        # Ensure these fields exist even if no activity
+        item.setdefault("involved_users", [])
+        item.setdefault("interaction_types", {})
+    for key, act in board_activity.items():
+        item = board_index[key]
+        # Kept as sets; save_board_items writes them out as lists
+        item["involved_users"] = act["users"]
+        item["interaction_types"] = interaction_lists(act["interactions"])
 
     print(f"\nFound {len(board_activity)} board items with user activity")
     print(f"Found {len(activity_items)} activity items not on board")
 
-    # Create and enrich activity items
-    new_items = []
-    for i, ((repo, number), data) in enumerate(activity_items.items()):
-        item = create_activity_item(
+    # Create activity items, then enrich them with GitHub details
+    base_items = [
+        create_activity_item(
             repo=repo,
             number=number,
             item_type=data["type"],
             activity_item=data["item"],
-            involved_users=list(data["users"]),
-            interaction_types=data["interactions"],
+            involved_users=data["users"],
+            interaction_types=interaction_lists(data["interactions"]),
         )
+        for (repo, number), data in activity_items.items()
+    ]
 
-        # Enrich with GitHub details
-        item = enrich_activity_item(item)
-        new_items.append(item)
+    bulk_details = fetch_details_bulk(list(activity_items))
+    item_details = [bulk_details.get(key) for key in activity_items]
 
-        if (i + 1) % 10 == 0:
-            print(f"  Enriched {i + 1}/{len(activity_items)} activity items")
+    # Anything the bulk query missed falls back to per-item fetches
+    new_items = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in executor.map(enrich_activity_item, base_items, item_details):
+            new_items.append(item)
+            if len(new_items) % 10 == 0:
+                print(f"  Enriched {len(new_items)}/{len(base_items)} activity items")
 
     print(f"  Enriched {len(new_items)} activity items")
 
@@ -276,7 +475,8 @@ def merge_activity_with_board(
     print(f"\nTotal items: {total} ({board_count} board + {activity_count} activity)")
 
     # Save merged items
-    save_board_items(all_items)
+    if not save_board_items(all_items):
+        print("board_items.json unchanged, not rewritten")
 
     return all_items
 
@@ -13,15 +13,19 @@ import argparse
 from pathlib import Path
 
 from fetch_board import (
+    clear_details_cache,
     enrich_board_items,
     fetch_board_items,
     get_all_users,
-    load_from_cache,
     save_to_cache,
 )
 from generate_report import save_report
 from import_summaries import import_summaries
-from merge_activity import INCLUDED_REPOS, merge_activity_with_board
+from merge_activity import (
+    INCLUDED_REPOS,
+    load_board_items,
+    merge_activity_with_board,
+)
 
 # Path to summaries file
 SUMMARIES_FILE = Path(__file__).parent / "summaries.json"
@@ -34,6 +38,7 @@ def run_board_summary(
     lookback_days: int = 14,
     output: str = "board_summary.html",
     skip_fetch: bool = False,
+    refresh: bool = False,
 ):
     """Run the complete board summary workflow.
 
@@ -42,17 +47,18 @@ def run_board_summary(
         lookback_days: Number of days to look back for activity.
         output: Output file path for the HTML report.
         skip_fetch: If True, use cached data instead of fetching fresh data.
+        refresh: If True, refetch GitHub data instead of reusing recent caches.
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if refresh:
+        clear_details_cache()
 
     # Step 1: Fetch and enrich board items
     if skip_fetch and (CACHE_DIR / "board_items.json").exists():
         print("Using cached board items...")
-        enriched_items = load_from_cache()
-        # Get board-only items (before merge) for user detection
-        board_only_items = [
-            i for i in enriched_items if i.get("board_status") != "Not Included"
-        ]
+        # Board-only items (before merge) for user detection; fetch_board
+        # keeps them in board_items_original.json, so nothing to filter
+        board_only_items = load_board_items()
     else:
         print("=" * 50)
         print("Step 1: Fetching board items")
@@ -80,7 +86,7 @@ def run_board_summary(
         print()
 
         # This fetches activity, merges with board items, and saves both
-        merge_activity_with_board(users, lookback_days=lookback_days)
+        merge_activity_with_board(users, lookback_days=lookback_days, refresh=refresh)
 
     # Step 3: Import AI summaries (if summaries.json exists)
     if SUMMARIES_FILE.exists():
@@ -134,6 +140,11 @@ def main():
         action="store_true",
         help="Use cached data instead of fetching fresh data",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore recently cached GitHub data and refetch it",
+    )
 
     args = parser.parse_args()
 
@@ -144,6 +155,7 @@ def main():
         lookback_days=args.lookback,
         output=args.output,
         skip_fetch=args.skip_fetch,
+        refresh=args.refresh,
     )
 
 
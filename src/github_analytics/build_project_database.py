@@ -1,15 +1,18 @@
 """Script to build a comprehensive SQLite database of GitHub project data."""
 
 import argparse
-import json
+import hashlib
 import os
 import signal
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
 from dotenv import load_dotenv
 from requests.adapters import HTTPAdapter
@@ -35,6 +38,100 @@ console = Console()
 # Database path
 DB_PATH = Path("project_database.db")
 
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "cache_size=-65536",  # 64MB
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256MB
+    "wal_autocheckpoint=10000",  # pages; fewer checkpoints during long ingests
+)
+
+# Bumped whenever migrate_database learns a new migration
+SCHEMA_VERSION = 4
+
+# JSON-array columns mirrored into "<prefix>_<column>(<prefix>_number, name)"
+# side tables, so PRs/issues can be looked up by label, assignee or reviewer
+# without parsing every row
+LINKED_COLUMNS = {
+    "pull_requests": ("pr", ("assignees", "reviewers", "labels")),
+    "issues": ("issue", ("assignees", "labels")),
+}
+
+# Secondary indexes, keyed by table so bulk ingests can drop and rebuild them
+INDEXES = {
+    "pull_requests": {
+        "idx_pr_state": "state",
+        "idx_pr_created": "created_at",
+        "idx_pr_updated": "updated_at",
+    },
+    "issues": {
+        "idx_issue_state": "state",
+        "idx_issue_created": "created_at",
+        "idx_issue_updated": "updated_at",
+    },
+}
+
+# Below this many expected new rows, keeping the indexes is cheaper than
+# rebuilding them
+BULK_INDEX_THRESHOLD = 1000
+
+# GraphQL page sizes: GitHub allows up to 100 nodes per page
+MAX_PAGE_SIZE = 100
+MIN_PAGE_SIZE = 25
+
+# Pause once fewer than this many GraphQL points are left in the rate limit
+RATE_LIMIT_RESERVE = 50
+
+# Full fetches walk PRs/issues oldest first; incremental updates walk them most
+# recently updated first and stop at the first unchanged one
+FULL_FETCH_ORDER = {"field": "CREATED_AT", "direction": "ASC"}
+INCREMENTAL_ORDER = {"field": "UPDATED_AT", "direction": "DESC"}
+
+# Pages are buffered until this many rows are pending, then written in one commit
+COMMIT_BATCH_ROWS = 500
+
+# Statements are kept at module level so sqlite3's statement cache reuses them
+PR_INSERT_SQL = """
+    INSERT OR IGNORE INTO pull_requests (
+        number, title, body, created_at, updated_at, closed_at, merged_at,
+        state, draft, author, assignees, reviewers, labels, milestone,
+        additions, deletions, changed_files, url, last_event_at, fetched_at,
+        content_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+ISSUE_INSERT_SQL = """
+    INSERT OR IGNORE INTO issues (
+        number, title, body, created_at, updated_at, closed_at, state,
+        author, assignees, labels, milestone, comments_count, url,
+        last_event_at, fetched_at, content_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Issues that are not PRs, written as an anti-join so SQLite probes the
+# pull_requests rowid instead of evaluating a NOT IN subquery
+ISSUE_COUNT_SQL = """
+    SELECT COUNT(*) FROM issues
+    LEFT JOIN pull_requests USING (number)
+    WHERE pull_requests.number IS NULL
+"""
+
+# Incremental updates overwrite rows that changed since the last sync
+PR_REPLACE_SQL = PR_INSERT_SQL.replace("OR IGNORE", "OR REPLACE", 1)
+ISSUE_REPLACE_SQL = ISSUE_INSERT_SQL.replace("OR IGNORE", "OR REPLACE", 1)
+
+# Columns of sync_progress that update_sync_progress may set
+SYNC_PROGRESS_COLUMNS = (
+    "last_pr_number",
+    "last_issue_number",
+    "total_prs",
+    "total_issues",
+    "last_pr_cursor",
+    "last_issue_cursor",
+    "last_sync_at",
+)
+
 # Global flag for graceful shutdown
 shutdown_requested = False
 
@@ -90,12 +187,12 @@ class GitHubGraphQLClient:
                 response = self.session.post(
                     self.endpoint,
                     headers=self.headers,
-                    json=payload,
+                    data=orjson.dumps(payload),
                     timeout=60,  # Increased timeout
                 )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     if "errors" in result:
                         # Check if it's a rate limit error
                         for error in result["errors"]:
@@ -136,11 +233,45 @@ class GitHubGraphQLClient:
                 raise
 
 
+def wait_for_rate_limit(rate_limit: dict[str, Any] | None, elapsed: float = 0.0):
+    """Pace requests so the remaining rate limit budget lasts until its reset.
+
+    Args:
+        rate_limit: The ``rateLimit`` object of the last GraphQL response.
+        elapsed: Seconds since the request that returned ``rate_limit`` was sent.
+    """
+    if not rate_limit:
+        return
+
+    reset_at = datetime.fromisoformat(rate_limit["resetAt"].replace("Z", "+00:00"))
+    until_reset = (reset_at - datetime.now(timezone.utc)).total_seconds()
+    remaining = rate_limit["remaining"]
+    if remaining < RATE_LIMIT_RESERVE:
+        wait_seconds = until_reset + 5
+        if wait_seconds > 0:
+            console.print(
+                f"[yellow]Rate limit low ({remaining}), waiting "
+                f"{wait_seconds:.0f} seconds...[/yellow]"
+            )
+            time.sleep(wait_seconds)
+        return
+
+    # Spread the remaining points evenly over the time left in the window
+    wait_seconds = until_reset * rate_limit["cost"] / remaining - elapsed
+    if wait_seconds > 0:
+        time.sleep(wait_seconds)
+
+
 def init_database() -> sqlite3.Connection:
     """Initialize SQLite database with required tables."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, cached_statements=256)
     cursor = conn.cursor()
 
+    # Tune SQLite for a write-heavy ingest: WAL avoids an fsync per commit and
+    # the larger cache keeps index pages in memory between batches.
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+
     # Create pull_requests table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS pull_requests (
@@ -164,6 +295,7 @@ def init_database() -> sqlite3.Connection:
             url TEXT NOT NULL,
             last_event_at TEXT,
             fetched_at TEXT NOT NULL,
+            content_hash TEXT,
             UNIQUE(number)
         )
     """)
@@ -186,6 +318,7 @@ def init_database() -> sqlite3.Connection:
             url TEXT NOT NULL,
             last_event_at TEXT,
             fetched_at TEXT NOT NULL,
+            content_hash TEXT,
             UNIQUE(number)
         )
     """)
@@ -206,101 +339,146 @@ def init_database() -> sqlite3.Connection:
         )
     """)
 
-    # Create indexes for better query performance
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_pr_number ON pull_requests(number);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_pr_state ON pull_requests(state);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_pr_created ON pull_requests(created_at);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_issue_number ON issues(number);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_issue_state ON issues(state);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_issue_created ON issues(created_at);
-    """)
-
+    create_link_tables(conn)
+    create_indexes(conn)
+    migrate_database(conn)
     conn.commit()
     return conn
 
 
-def get_sync_progress(conn: sqlite3.Connection, repo_name: str) -> dict[str, Any]:
-    """Get current sync progress for a repository."""
-    cursor = conn.cursor()
+def migrate_database(conn: sqlite3.Connection):
+    """Bring databases created by older versions up to SCHEMA_VERSION.
 
-    # First check if columns exist (for backward compatibility)
-    cursor.execute("PRAGMA table_info(sync_progress)")
-    columns = [row[1] for row in cursor.fetchall()]
-
-    if "last_pr_cursor" in columns and "last_issue_cursor" in columns:
-        cursor.execute(
-            """
-            SELECT last_pr_number, last_issue_number, total_prs, total_issues,
-                   last_pr_cursor, last_issue_cursor, last_sync_at
-            FROM sync_progress WHERE repo_name = ?
-        """,
-            (repo_name,),
-        )
-        result = cursor.fetchone()
-        if result:
-            return {
-                "last_pr_number": result[0],
-                "last_issue_number": result[1],
-                "total_prs": result[2],
-                "total_issues": result[3],
-                "last_pr_cursor": result[4],
-                "last_issue_cursor": result[5],
-                "last_sync_at": result[6],
-            }
-    else:
-        # Old schema, migrate it
-        cursor.execute(
-            """
-            SELECT last_pr_number, last_issue_number, total_prs, total_issues,
-            last_sync_at
-            FROM sync_progress WHERE repo_name = ?
-        """,
-            (repo_name,),
-        )
-        result = cursor.fetchone()
-        if result:
-            # Add missing columns
-            cursor.execute("ALTER TABLE sync_progress ADD COLUMN last_pr_cursor TEXT")
-            cursor.execute(
-                "ALTER TABLE sync_progress ADD COLUMN last_issue_cursor TEXT"
+    The applied version is stored in ``PRAGMA user_version`` so the checks only
+    run once per database.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    if version < 1:
+        # Version 1 added the pagination cursors to sync_progress
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sync_progress)")}
+        for column in ("last_pr_cursor", "last_issue_cursor"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE sync_progress ADD COLUMN {column} TEXT")
+
+    if version < 2:
+        # Version 2 added the side tables; fill them from the stored rows
+        for table, (prefix, columns) in LINKED_COLUMNS.items():
+            for column in columns:
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO {prefix}_{column}
+                    SELECT {table}.number, value FROM {table}, json_each({column})
+                """)
+
+    if version < 3:
+        # Version 3 added content_hash; old rows keep NULL until re-fetched
+        for table in ("pull_requests", "issues"):
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if "content_hash" not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN content_hash TEXT")
+
+    if version < 4:
+        # Version 4 dropped the number indexes; number is the rowid already
+        conn.execute("DROP INDEX IF EXISTS idx_pr_number")
+        conn.execute("DROP INDEX IF EXISTS idx_issue_number")
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def create_link_tables(conn: sqlite3.Connection):
+    """Create the side tables for LINKED_COLUMNS and the triggers filling them.
+
+    The triggers run after a row is actually inserted (including by INSERT OR
+    REPLACE), so ignored rows never touch the side tables.
+    """
+    for table, (prefix, columns) in LINKED_COLUMNS.items():
+        statements = []
+        for column in columns:
+            link_table = f"{prefix}_{column}"
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {link_table} (
+                    {prefix}_number INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    PRIMARY KEY ({prefix}_number, name)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{link_table}_name "
+                f"ON {link_table}(name)"
             )
-            conn.commit()
-            return {
-                "last_pr_number": result[0],
-                "last_issue_number": result[1],
-                "total_prs": result[2],
-                "total_issues": result[3],
-                "last_pr_cursor": None,
-                "last_issue_cursor": None,
-                "last_sync_at": result[4],
-            }
+            statements.append(f"""
+                DELETE FROM {link_table} WHERE {prefix}_number = NEW.number;
+                INSERT OR IGNORE INTO {link_table}
+                SELECT NEW.number, value FROM json_each(NEW.{column});
+            """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_links AFTER INSERT ON {table}
+            BEGIN
+                {"".join(statements)}
+            END
+        """)
+
+
+def create_indexes(conn: sqlite3.Connection, table: str | None = None):
+    """Create the secondary indexes for one table, or for all tables."""
+    tables = [table] if table else list(INDEXES)
+    for name in tables:
+        for index, column in INDEXES[name].items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {name}({column})")
+    conn.commit()
 
-    # Initialize progress tracking if not exists
+
+def drop_indexes(conn: sqlite3.Connection, table: str):
+    """Drop the secondary indexes of a table."""
+    for index in INDEXES[table]:
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+    conn.commit()
+
+
+@contextmanager
+def bulk_mode(conn: sqlite3.Connection, table: str, enabled: bool = True):
+    """Drop a table's secondary indexes during a bulk ingest.
+
+    The indexes are rebuilt once on exit, including when the fetch loop stops
+    early because of a shutdown request or an error.
+    """
+    if not enabled:
+        yield
+        return
+
+    console.print(f"[dim]Dropping indexes on {table} during bulk ingest[/dim]")
+    drop_indexes(conn, table)
     try:
-        cursor.execute(
-            """
-            INSERT INTO sync_progress (repo_name, last_pr_number, last_issue_number,
-            total_prs, total_issues, last_pr_cursor, last_issue_cursor)
-            VALUES (?, 0, 0, 0, 0, NULL, NULL)
-        """,
-            (repo_name,),
-        )
-        conn.commit()
-    except sqlite3.IntegrityError:
-        # Record already exists, which is fine
-        pass
+        yield
+    finally:
+        console.print(f"[dim]Rebuilding indexes on {table}[/dim]")
+        create_indexes(conn, table)
+
 
+def get_sync_progress(conn: sqlite3.Connection, repo_name: str) -> dict[str, Any]:
+    """Get current sync progress for a repository."""
+    result = conn.execute(
+        """
+        SELECT last_pr_number, last_issue_number, total_prs, total_issues,
+               last_pr_cursor, last_issue_cursor, last_sync_at
+        FROM sync_progress WHERE repo_name = ?
+    """,
+        (repo_name,),
+    ).fetchone()
+    if result:
+        return {
+            "last_pr_number": result[0],
+            "last_issue_number": result[1],
+            "total_prs": result[2],
+            "total_issues": result[3],
+            "last_pr_cursor": result[4],
+            "last_issue_cursor": result[5],
+            "last_sync_at": result[6],
+        }
+
+    # No row yet; update_sync_progress creates it on first write
     return {
         "last_pr_number": 0,
         "last_issue_number": 0,
@@ -313,34 +491,24 @@ def get_sync_progress(conn: sqlite3.Connection, repo_name: str) -> dict[str, Any
 
 
 def update_sync_progress(conn: sqlite3.Connection, repo_name: str, **kwargs):
-    """Update sync progress."""
-    cursor = conn.cursor()
+    """Update sync progress, creating the repository's row if needed.
 
-    # Build dynamic UPDATE query
-    updates = []
-    values = []
-    for key, value in kwargs.items():
-        if key in [
-            "last_pr_number",
-            "last_issue_number",
-            "total_prs",
-            "total_issues",
-            "last_pr_cursor",
-            "last_issue_cursor",
-            "last_sync_at",
-        ]:
-            updates.append(f"{key} = ?")
-            values.append(value)
-
-    if updates:
-        values.append(repo_name)
-        cursor.execute(
-            f"""
-            UPDATE sync_progress SET {", ".join(updates)} WHERE repo_name = ?
-        """,
-            values,
-        )
-        conn.commit()
+    Nothing is committed here; callers wrap this in ``with conn:`` so the
+    progress lands in the same transaction as the data it describes.
+    """
+    columns = [key for key in kwargs if key in SYNC_PROGRESS_COLUMNS]
+    if not columns:
+        return
+
+    conn.execute(
+        f"""
+        INSERT INTO sync_progress (repo_name, {", ".join(columns)})
+        VALUES (?{", ?" * len(columns)})
+        ON CONFLICT(repo_name) DO UPDATE SET
+            {", ".join(f"{column} = excluded.{column}" for column in columns)}
+    """,
+        [repo_name, *(kwargs[column] for column in columns)],
+    )
 
 
 def get_repo_counts_query() -> str:
@@ -359,97 +527,27 @@ def get_repo_counts_query() -> str:
     """
 
 
-def get_prs_query(since_date: str | None = None) -> str:
+def get_prs_query() -> str:
     """GraphQL query to fetch PR details.
 
-    Args:
-        since_date: ISO format date string to fetch PRs created  after this date
+    The order is passed in the ``orderBy`` variable: ``FULL_FETCH_ORDER`` for
+    full fetches and ``INCREMENTAL_ORDER`` for incremental updates.
     """
-    # Build the filter string if we have a since date
-    if since_date:
-        # GitHub doesn't support direct date filtering in pullRequests,
-        # so we'll use search query instead for better efficiency
-        return """
-        query($query: String!, $first: Int!, $after: String) {
-            search(query: $query, type: ISSUE, first: $first, after: $after) {
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-                issueCount
-                nodes {
-                    ... on PullRequest {
-                        number
-                        title
-                        body
-                        createdAt
-                        updatedAt
-                        closedAt
-                        mergedAt
-                        state
-                        isDraft
-                        author {
-                            login
-                        }
-                        assignees(first: 10) {
-                            nodes {
-                                login
-                            }
-                        }
-                        reviewRequests(first: 10) {
-                            nodes {
-                                requestedReviewer {
-                                    ... on User {
-                                        login
-                                    }
-                                }
-                            }
-                        }
-                        labels(first: 20) {
-                            nodes {
-                                name
-                            }
-                        }
-                        milestone {
-                            title
-                        }
-                        additions
-                        deletions
-                        changedFiles
-                        url
-                        timelineItems(last: 1) {
-                            nodes {
-                                ... on IssueComment {
-                                    createdAt
-                                }
-                                ... on PullRequestCommit {
-                                    commit {
-                                        authoredDate
-                                    }
-                                }
-                                ... on PullRequestReview {
-                                    createdAt
-                                }
-                                ... on ClosedEvent {
-                                    createdAt
-                                }
-                                ... on MergedEvent {
-                                    createdAt
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-    # Original query for full fetch
     return """
-    query($owner: String!, $name: String!, $first: Int!, $after: String) {
+    query(
+        $owner: String!,
+        $name: String!,
+        $first: Int!,
+        $after: String,
+        $orderBy: IssueOrder!
+    ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
-            pullRequests(first: $first, after: $after, orderBy:
-            {field: CREATED_AT, direction: ASC}) {
+            pullRequests(first: $first, after: $after, orderBy: $orderBy) {
                 pageInfo {
                     hasNextPage
                     endCursor
@@ -521,79 +619,35 @@ def get_prs_query(since_date: str | None = None) -> str:
     """
 
 
-def get_issues_query(since_date: str | None = None) -> str:
+def get_issues_query() -> str:
     """GraphQL query to fetch issue details.
 
-    Args:
-        since_date: ISO format date string to fetch issues created after this date
+    The order is passed in the ``orderBy`` variable: ``FULL_FETCH_ORDER`` for
+    full fetches and ``INCREMENTAL_ORDER`` for incremental updates. Incremental
+    updates also pass ``filterBy: {since: ...}`` so only issues updated since
+    the last sync are returned.
     """
-    if since_date:
-        # Use search API for efficient date filtering
-        return """
-        query($query: String!, $first: Int!, $after: String) {
-            search(query: $query, type: ISSUE, first: $first, after: $after) {
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-                issueCount
-                nodes {
-                    ... on Issue {
-                        number
-                        title
-                        body
-                        createdAt
-                        updatedAt
-                        closedAt
-                        state
-                        author {
-                            login
-                        }
-                        assignees(first: 10) {
-                            nodes {
-                                login
-                            }
-                        }
-                        labels(first: 20) {
-                            nodes {
-                                name
-                            }
-                        }
-                        milestone {
-                            title
-                        }
-                        comments {
-                            totalCount
-                        }
-                        url
-                        timelineItems(last: 1) {
-                            nodes {
-                                ... on IssueComment {
-                                    createdAt
-                                }
-                                ... on ClosedEvent {
-                                    createdAt
-                                }
-                                ... on ReopenedEvent {
-                                    createdAt
-                                }
-                                ... on LabeledEvent {
-                                    createdAt
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-    # Original query for full fetch
     return """
-    query($owner: String!, $name: String!, $first: Int!, $after: String) {
+    query(
+        $owner: String!,
+        $name: String!,
+        $first: Int!,
+        $after: String,
+        $orderBy: IssueOrder!,
+        $filterBy: IssueFilters
+    ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
-            issues(first: $first, after: $after, orderBy:
-            {field: CREATED_AT, direction: ASC}) {
+            issues(
+                first: $first,
+                after: $after,
+                orderBy: $orderBy,
+                filterBy: $filterBy
+            ) {
                 pageInfo {
                     hasNextPage
                     endCursor
@@ -651,136 +705,174 @@ def get_issues_query(since_date: str | None = None) -> str:
 
 def extract_last_event_time(timeline_items: list[dict]) -> str | None:
     """Extract the most recent event time from timeline items."""
-    if not timeline_items:
-        return None
-
-    latest_time = None
-    for item in timeline_items:
-        event_time = None
-        if "createdAt" in item:
-            event_time = item["createdAt"]
-        elif "commit" in item and "authoredDate" in item["commit"]:
-            event_time = item["commit"]["authoredDate"]
+    # ISO-8601 timestamps sort lexicographically, so max() on strings works
+    times = (
+        item.get("createdAt") or (item.get("commit") or {}).get("authoredDate")
+        for item in timeline_items
+    )
+    return max((t for t in times if t), default=None)
 
-        if event_time and (not latest_time or event_time > latest_time):
-            latest_time = event_time
 
-    return latest_time
+def content_hash(row: tuple) -> str:
+    """Hash a row's content, ignoring its updated_at and fetched_at values."""
+    content = orjson.dumps((row[:4], row[5:-1]))
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
-def save_prs_to_db(conn: sqlite3.Connection, prs: list[dict]):
-    """Save PRs to database."""
-    cursor = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat()
+def drop_unchanged_rows(
+    conn: sqlite3.Connection, table: str, rows: list[tuple]
+) -> list[tuple]:
+    """Return the rows whose content differs from the stored version.
 
-    for pr in prs:
-        assignees = json.dumps(
-            [a["login"] for a in pr.get("assignees", {}).get("nodes", [])]
+    Unchanged rows only get their updated_at and fetched_at refreshed, which is
+    much cheaper than replacing them.
+    """
+    if not rows:
+        return rows
+
+    placeholders = ",".join("?" * len(rows))
+    stored = dict(
+        conn.execute(
+            f"SELECT number, content_hash FROM {table} WHERE number IN "
+            f"({placeholders})",
+            [row[0] for row in rows],
+        )
+    )
+    changed = [row for row in rows if stored.get(row[0]) != row[-1]]
+    if len(changed) < len(rows):
+        conn.executemany(
+            f"UPDATE {table} SET updated_at = ?, fetched_at = ? WHERE number = ?",
+            [
+                (row[4], row[-2], row[0])
+                for row in rows
+                if stored.get(row[0]) == row[-1]
+            ],
         )
-        reviewers = json.dumps(
+    return changed
+
+
+def pr_to_row(pr: dict, fetched_at: str) -> tuple:
+    """Convert a PR node into a row for PR_INSERT_SQL."""
+    row = (
+        pr["number"],
+        pr["title"],
+        pr.get("body"),
+        pr["createdAt"],
+        pr["updatedAt"],
+        pr.get("closedAt"),
+        pr.get("mergedAt"),
+        pr["state"],
+        pr.get("isDraft", False),
+        pr.get("author", {}).get("login") if pr.get("author") else None,
+        orjson.dumps(
+            [a["login"] for a in pr.get("assignees", {}).get("nodes", [])]
+        ).decode(),
+        orjson.dumps(
             [
                 r["requestedReviewer"]["login"]
                 for r in pr.get("reviewRequests", {}).get("nodes", [])
                 if r.get("requestedReviewer") and "login" in r["requestedReviewer"]
             ]
-        )
-        labels = json.dumps(
+        ).decode(),
+        orjson.dumps(
             [label["name"] for label in pr.get("labels", {}).get("nodes", [])]
-        )
-
-        last_event_at = extract_last_event_time(
-            pr.get("timelineItems", {}).get("nodes", [])
-        )
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO pull_requests (
-                number, title, body, created_at, updated_at, closed_at, merged_at,
-                state, draft, author, assignees, reviewers, labels, milestone,
-                additions, deletions, changed_files, url, last_event_at, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                pr["number"],
-                pr["title"],
-                pr.get("body"),
-                pr["createdAt"],
-                pr["updatedAt"],
-                pr.get("closedAt"),
-                pr.get("mergedAt"),
-                pr["state"],
-                pr.get("isDraft", False),
-                pr.get("author", {}).get("login") if pr.get("author") else None,
-                assignees,
-                reviewers,
-                labels,
-                pr.get("milestone", {}).get("title") if pr.get("milestone") else None,
-                pr.get("additions", 0),
-                pr.get("deletions", 0),
-                pr.get("changedFiles", 0),
-                pr["url"],
-                last_event_at,
-                now,
-            ),
-        )
-
-    conn.commit()
-
-
-def save_issues_to_db(conn: sqlite3.Connection, issues: list[dict]):
-    """Save issues to database."""
-    cursor = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat()
-
-    for issue in issues:
-        assignees = json.dumps(
+        ).decode(),
+        pr.get("milestone", {}).get("title") if pr.get("milestone") else None,
+        pr.get("additions", 0),
+        pr.get("deletions", 0),
+        pr.get("changedFiles", 0),
+        pr["url"],
+        extract_last_event_time(pr.get("timelineItems", {}).get("nodes", [])),
+        fetched_at,
+    )
+    return (*row, content_hash(row))
+
+
+def issue_to_row(issue: dict, fetched_at: str) -> tuple:
+    """Convert an issue node into a row for ISSUE_INSERT_SQL."""
+    row = (
+        issue["number"],
+        issue["title"],
+        issue.get("body"),
+        issue["createdAt"],
+        issue["updatedAt"],
+        issue.get("closedAt"),
+        issue["state"],
+        issue.get("author", {}).get("login") if issue.get("author") else None,
+        orjson.dumps(
             [a["login"] for a in issue.get("assignees", {}).get("nodes", [])]
-        )
-        labels = json.dumps(
+        ).decode(),
+        orjson.dumps(
             [label["name"] for label in issue.get("labels", {}).get("nodes", [])]
-        )
-
-        last_event_at = extract_last_event_time(
-            issue.get("timelineItems", {}).get("nodes", [])
-        )
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO issues (
-                number, title, body, created_at, updated_at, closed_at, state,
-                author, assignees, labels, milestone, comments_count, url,
-                last_event_at, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                issue["number"],
-                issue["title"],
-                issue.get("body"),
-                issue["createdAt"],
-                issue["updatedAt"],
-                issue.get("closedAt"),
-                issue["state"],
-                issue.get("author", {}).get("login") if issue.get("author") else None,
-                assignees,
-                labels,
-                issue.get("milestone", {}).get("title")
-                if issue.get("milestone")
-                else None,
-                issue.get("comments", {}).get("totalCount", 0),
-                issue["url"],
-                last_event_at,
-                now,
-            ),
-        )
-
-    conn.commit()
+        ).decode(),
+        issue.get("milestone", {}).get("title") if issue.get("milestone") else None,
+        issue.get("comments", {}).get("totalCount", 0),
+        issue["url"],
+        extract_last_event_time(issue.get("timelineItems", {}).get("nodes", [])),
+        fetched_at,
+    )
+    return (*row, content_hash(row))
+
+
+def save_prs_to_db(
+    conn: sqlite3.Connection,
+    prs: list[dict],
+    repo_name: str | None = None,
+    replace: bool = False,
+    **progress,
+) -> int:
+    """Save new PRs to database in a single transaction.
+
+    PRs already in the database are left untouched unless ``replace`` is
+    set. If ``repo_name`` is given, ``progress`` is recorded with
+    ``update_sync_progress`` in the same transaction so the saved cursor never
+    runs ahead of the saved rows.
+    Returns the number of rows actually inserted.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [pr_to_row(pr, now) for pr in prs]
+    with conn:
+        if replace:
+            rows = drop_unchanged_rows(conn, "pull_requests", rows)
+        sql = PR_REPLACE_SQL if replace else PR_INSERT_SQL
+        inserted = conn.executemany(sql, rows).rowcount
+        if repo_name:
+            update_sync_progress(conn, repo_name, **progress)
+    return inserted
+
+
+def save_issues_to_db(
+    conn: sqlite3.Connection,
+    issues: list[dict],
+    repo_name: str | None = None,
+    replace: bool = False,
+    **progress,
+) -> int:
+    """Save new issues to database in a single transaction.
+
+    Issues already in the database are left untouched unless ``replace`` is
+    set. If ``repo_name`` is given, ``progress`` is recorded with
+    ``update_sync_progress`` in the same transaction so the saved cursor never
+    runs ahead of the saved rows.
+    Returns the number of rows actually inserted.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [issue_to_row(issue, now) for issue in issues]
+    with conn:
+        if replace:
+            rows = drop_unchanged_rows(conn, "issues", rows)
+        sql = ISSUE_REPLACE_SQL if replace else ISSUE_INSERT_SQL
+        inserted = conn.executemany(sql, rows).rowcount
+        if repo_name:
+            update_sync_progress(conn, repo_name, **progress)
+    return inserted
 
 
 def fetch_all_prs(
     client: GitHubGraphQLClient, owner: str, repo: str, conn: sqlite3.Connection
 ):
     """Fetch all PRs using GraphQL pagination with error recovery."""
-    batch_size = 25  # Reduced batch size for more reliable requests
+    batch_size = MAX_PAGE_SIZE  # Shrinks towards MIN_PAGE_SIZE on errors
 
     progress = get_sync_progress(conn, f"{owner}/{repo}")
     total_count = progress["total_prs"]
@@ -792,9 +884,9 @@ def fetch_all_prs(
     cursor_db.execute("SELECT COUNT(*) FROM pull_requests")
     already_processed = cursor_db.fetchone()[0]
 
-    # Get the most recent PR creation date from our database
+    # Get the most recent PR update time from our database
     cursor_db.execute("""
-        SELECT MAX(created_at) FROM pull_requests
+        SELECT MAX(updated_at) FROM pull_requests
     """)
     result = cursor_db.fetchone()
     most_recent_date = result[0] if result and result[0] else None
@@ -809,10 +901,10 @@ def fetch_all_prs(
     if use_incremental:
         console.print(
             f"[blue]Found {already_processed} existing PRs, using incremental fetch "
-            "for newer PRs[/blue]"
+            "for updated PRs[/blue]"
         )
-        console.print(f"[dim]Fetching PRs created after {most_recent_date}[/dim]")
-        query = get_prs_query(since_date=most_recent_date)
+        console.print(f"[dim]Fetching PRs updated after {most_recent_date}[/dim]")
+        query = get_prs_query()
     elif cursor and last_pr_number > 0 and already_processed > 0:
         console.print(
             f"[blue]Resuming from PR #{last_pr_number}, {remaining_count} PRs "
@@ -832,45 +924,45 @@ def fetch_all_prs(
         console.print(f"[blue]Starting fresh fetch of {total_count} PRs[/blue]")
         query = get_prs_query()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress_bar:
+    bulk = not use_incremental and remaining_count >= BULK_INDEX_THRESHOLD
+    with (
+        bulk_mode(conn, "pull_requests", enabled=bulk),
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress_bar,
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
         task = progress_bar.add_task(
             "Fetching PRs...", total=remaining_count, completed=0
         )
+        pending_prs = []
+        pending_progress = {}
+        prefetch = None  # (cursor, future, sent at) of the next page, if requested
 
         while True:
-            if use_incremental:
-                # Build search query for incremental fetch
-                search_query = f"repo:{owner}/{repo} is:pr created:>{most_recent_date}"
-                variables = {
-                    "query": search_query,
-                    "first": batch_size,
-                    "after": cursor,
-                }
-            else:
-                variables = {
-                    "owner": owner,
-                    "name": repo,
-                    "first": batch_size,
-                    "after": cursor,
-                }
+            variables = {
+                "owner": owner,
+                "name": repo,
+                "first": batch_size,
+                "after": cursor,
+                "orderBy": INCREMENTAL_ORDER if use_incremental else FULL_FETCH_ORDER,
+            }
 
             try:
-                result = client.query(query, variables)
-                if use_incremental:
-                    prs_data = result["data"]["search"]
-                    # Filter to only get PullRequests (search can return mixed types)
-                    prs_data["nodes"] = [
-                        node for node in prs_data.get("nodes", []) if node
-                    ]
+                # Use the page requested in the background if it is the one we need
+                prefetched, prefetch = prefetch, None
+                if prefetched and prefetched[0] == cursor:
+                    result = prefetched[1].result()
+                    requested_at = prefetched[2]
                 else:
-                    prs_data = result["data"]["repository"]["pullRequests"]
+                    requested_at = time.monotonic()
+                    result = client.query(query, variables)
+                prs_data = result["data"]["repository"]["pullRequests"]
 
                 if not prs_data["nodes"]:
                     console.print(
@@ -883,39 +975,61 @@ def fetch_all_prs(
                     console.print("[yellow]Stopping PR fetch as requested...[/yellow]")
                     break
 
-                # Check which PRs are new (not in database)
-                pr_numbers = [pr["number"] for pr in prs_data["nodes"]]
-                cursor_db = conn.cursor()
-                placeholders = ",".join(["?"] * len(pr_numbers))
-                cursor_db.execute(
-                    "SELECT number FROM pull_requests WHERE number IN "
-                    f"({placeholders})",
-                    pr_numbers,
-                )
-                existing_prs = {row[0] for row in cursor_db.fetchall()}
+                # Incremental pages are ordered by UPDATED_AT DESC, so stop at
+                # the first PR that has not changed since the last sync
+                reached_known = False
+                if use_incremental:
+                    updated = [
+                        pr
+                        for pr in prs_data["nodes"]
+                        if pr["updatedAt"] > most_recent_date
+                    ]
+                    reached_known = len(updated) < len(prs_data["nodes"])
+                    prs_data["nodes"] = updated
+                    if not updated:
+                        console.print(
+                            "[green]No more updated PRs - all caught up![/green]"
+                        )
+                        break
+
+                # Request the next page while this one is being saved
+                page_info = prs_data["pageInfo"]
+                has_next_page = page_info["hasNextPage"] and not reached_known
+                if has_next_page:
+                    wait_for_rate_limit(
+                        result["data"].get("rateLimit"),
+                        time.monotonic() - requested_at,
+                    )
+                    next_variables = {**variables, "after": page_info["endCursor"]}
+                    prefetch = (
+                        page_info["endCursor"],
+                        executor.submit(client.query, query, next_variables),
+                        time.monotonic(),
+                    )
 
-                new_prs = [
-                    pr for pr in prs_data["nodes"] if pr["number"] not in existing_prs
-                ]
+                # Buffer the page; PRs already in the database are skipped
+                # (or replaced, for incremental updates) when it is written
+                pending_prs.extend(prs_data["nodes"])
+                last_pr = max(pr["number"] for pr in prs_data["nodes"])
+                if not use_incremental:
+                    # The cursor only makes sense to resume the full fetch order
+                    pending_progress = {
+                        "last_pr_number": last_pr,
+                        "last_pr_cursor": prs_data["pageInfo"]["endCursor"],
+                    }
 
-                if new_prs:
-                    # Save only new PRs
-                    save_prs_to_db(conn, new_prs)
-                    batch_prs = len(new_prs)
+                if len(pending_prs) >= COMMIT_BATCH_ROWS or not has_next_page:
+                    batch_prs = save_prs_to_db(
+                        conn,
+                        pending_prs,
+                        f"{owner}/{repo}",
+                        replace=use_incremental,
+                        **pending_progress,
+                    )
+                    pending_prs.clear()
                 else:
                     batch_prs = 0
 
-                # Update progress with current cursor for resumption
-                last_pr = max(pr["number"] for pr in prs_data["nodes"])
-                next_cursor = prs_data["pageInfo"]["endCursor"]
-
-                update_sync_progress(
-                    conn,
-                    f"{owner}/{repo}",
-                    last_pr_number=last_pr,
-                    last_pr_cursor=next_cursor,
-                )
-
                 if batch_prs > 0:
                     progress_bar.update(
                         task,
@@ -924,6 +1038,14 @@ def fetch_all_prs(
                             f"Fetching PRs (last: #{last_pr}, new: {batch_prs})"
                         ),
                     )
+                elif pending_prs:
+                    progress_bar.update(
+                        task,
+                        description=(
+                            f"Fetching PRs (last: #{last_pr}, "
+                            f"buffered: {len(pending_prs)})"
+                        ),
+                    )
                 else:
                     progress_bar.update(
                         task,
@@ -931,28 +1053,38 @@ def fetch_all_prs(
                     )
 
                 # Check if we have more pages
-                if not prs_data["pageInfo"]["hasNextPage"]:
+                if not has_next_page:
                     break
 
                 cursor = prs_data["pageInfo"]["endCursor"]
 
-                # Rate limiting
-                time.sleep(0.2)  # Slightly longer delay
-
             except Exception as e:
                 console.print(
                     f"[red]Error fetching PR batch (cursor: {cursor}): {e}[/red]"
                 )
                 console.print("[yellow]Waiting 10 seconds before retrying...[/yellow]")
                 time.sleep(10)
-                # Continue with same cursor to retry
+                # Large pages are the usual cause of timeouts and 502s, so retry
+                # the same cursor with a smaller page
+                batch_size = max(MIN_PAGE_SIZE, batch_size // 2)
+
+        # Write whatever is still buffered when the loop stops early
+        if pending_prs:
+            batch_prs = save_prs_to_db(
+                conn,
+                pending_prs,
+                f"{owner}/{repo}",
+                replace=use_incremental,
+                **pending_progress,
+            )
+            progress_bar.update(task, advance=batch_prs)
 
 
 def fetch_all_issues(
     client: GitHubGraphQLClient, owner: str, repo: str, conn: sqlite3.Connection
 ):
     """Fetch all issues using GraphQL pagination with error recovery."""
-    batch_size = 25  # Reduced batch size for more reliable requests
+    batch_size = MAX_PAGE_SIZE  # Shrinks towards MIN_PAGE_SIZE on errors
 
     progress = get_sync_progress(conn, f"{owner}/{repo}")
     total_count = progress["total_issues"]
@@ -961,15 +1093,12 @@ def fetch_all_issues(
 
     # Count how many issues we already have (excluding PRs)
     cursor_db = conn.cursor()
-    cursor_db.execute(
-        "SELECT COUNT(*) FROM issues WHERE number NOT IN (SELECT number FROM "
-        "pull_requests)"
-    )
+    cursor_db.execute(ISSUE_COUNT_SQL)
     already_processed = cursor_db.fetchone()[0]
 
-    # Get the most recent issue creation date from our database (excluding PRs)
+    # Get the most recent issue update time from our database (excluding PRs)
     cursor_db.execute("""
-        SELECT MAX(created_at) FROM issues
+        SELECT MAX(updated_at) FROM issues
         WHERE number NOT IN (SELECT number FROM pull_requests)
     """)
     result = cursor_db.fetchone()
@@ -985,10 +1114,10 @@ def fetch_all_issues(
     if use_incremental:
         console.print(
             f"[blue]Found {already_processed} existing issues, using incremental fetch "
-            "for newer issues[/blue]"
+            "for updated issues[/blue]"
         )
-        console.print(f"[dim]Fetching issues created after {most_recent_date}[/dim]")
-        query = get_issues_query(since_date=most_recent_date)
+        console.print(f"[dim]Fetching issues updated after {most_recent_date}[/dim]")
+        query = get_issues_query()
     elif cursor and last_issue_number > 0 and already_processed > 0:
         console.print(
             f"[blue]Resuming from Issue #{last_issue_number}, {remaining_count} issues "
@@ -1008,47 +1137,48 @@ def fetch_all_issues(
         console.print(f"[blue]Starting fresh fetch of {total_count} issues[/blue]")
         query = get_issues_query()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress_bar:
+    bulk = not use_incremental and remaining_count >= BULK_INDEX_THRESHOLD
+    with (
+        bulk_mode(conn, "issues", enabled=bulk),
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress_bar,
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
         task = progress_bar.add_task(
             "Fetching Issues...", total=remaining_count, completed=0
         )
+        pending_issues = []
+        pending_progress = {}
+        prefetch = None  # (cursor, future, sent at) of the next page, if requested
 
         while True:
+            variables = {
+                "owner": owner,
+                "name": repo,
+                "first": batch_size,
+                "after": cursor,
+                "orderBy": INCREMENTAL_ORDER if use_incremental else FULL_FETCH_ORDER,
+            }
             if use_incremental:
-                # Build search query for incremental fetch (exclude PRs)
-                search_query = (
-                    f"repo:{owner}/{repo} is:issue created:>{most_recent_date}"
-                )
-                variables = {
-                    "query": search_query,
-                    "first": batch_size,
-                    "after": cursor,
-                }
-            else:
-                variables = {
-                    "owner": owner,
-                    "name": repo,
-                    "first": batch_size,
-                    "after": cursor,
-                }
+                # Let GitHub drop issues that haven't changed since the last sync
+                variables["filterBy"] = {"since": most_recent_date}
 
             try:
-                result = client.query(query, variables)
-                if use_incremental:
-                    issues_data = result["data"]["search"]
-                    # Filter to only get Issues (search can return mixed types)
-                    issues_data["nodes"] = [
-                        node for node in issues_data.get("nodes", []) if node
-                    ]
+                # Use the page requested in the background if it is the one we need
+                prefetched, prefetch = prefetch, None
+                if prefetched and prefetched[0] == cursor:
+                    result = prefetched[1].result()
+                    requested_at = prefetched[2]
                 else:
-                    issues_data = result["data"]["repository"]["issues"]
+                    requested_at = time.monotonic()
+                    result = client.query(query, variables)
+                issues_data = result["data"]["repository"]["issues"]
 
                 if not issues_data["nodes"]:
                     console.print(
@@ -1063,39 +1193,60 @@ def fetch_all_issues(
                     )
                     break
 
-                # Check which issues are new (not in database)
-                issue_numbers = [issue["number"] for issue in issues_data["nodes"]]
-                cursor_db = conn.cursor()
-                placeholders = ",".join(["?"] * len(issue_numbers))
-                cursor_db.execute(
-                    f"SELECT number FROM issues WHERE number IN ({placeholders})",
-                    issue_numbers,
-                )
-                existing_issues = {row[0] for row in cursor_db.fetchall()}
-
-                new_issues = [
-                    issue
-                    for issue in issues_data["nodes"]
-                    if issue["number"] not in existing_issues
-                ]
-
-                if new_issues:
-                    # Save only new issues
-                    save_issues_to_db(conn, new_issues)
-                    batch_issues = len(new_issues)
-                else:
-                    batch_issues = 0
+                # Incremental pages are ordered by UPDATED_AT DESC, so stop at
+                # the first issue that has not changed since the last sync
+                reached_known = False
+                if use_incremental:
+                    updated = [
+                        issue
+                        for issue in issues_data["nodes"]
+                        if issue["updatedAt"] > most_recent_date
+                    ]
+                    reached_known = len(updated) < len(issues_data["nodes"])
+                    issues_data["nodes"] = updated
+                    if not updated:
+                        console.print(
+                            "[green]No more updated issues - all caught up![/green]"
+                        )
+                        break
+
+                # Request the next page while this one is being saved
+                page_info = issues_data["pageInfo"]
+                has_next_page = page_info["hasNextPage"] and not reached_known
+                if has_next_page:
+                    wait_for_rate_limit(
+                        result["data"].get("rateLimit"),
+                        time.monotonic() - requested_at,
+                    )
+                    next_variables = {**variables, "after": page_info["endCursor"]}
+                    prefetch = (
+                        page_info["endCursor"],
+                        executor.submit(client.query, query, next_variables),
+                        time.monotonic(),
+                    )
 
-                # Update progress with current cursor for resumption
+                # Buffer the page; issues already in the database are skipped
+                # (or replaced, for incremental updates) when it is written
+                pending_issues.extend(issues_data["nodes"])
                 last_issue = max(issue["number"] for issue in issues_data["nodes"])
-                next_cursor = issues_data["pageInfo"]["endCursor"]
+                if not use_incremental:
+                    # The cursor only makes sense to resume the full fetch order
+                    pending_progress = {
+                        "last_issue_number": last_issue,
+                        "last_issue_cursor": issues_data["pageInfo"]["endCursor"],
+                    }
 
-                update_sync_progress(
-                    conn,
-                    f"{owner}/{repo}",
-                    last_issue_number=last_issue,
-                    last_issue_cursor=next_cursor,
-                )
+                if len(pending_issues) >= COMMIT_BATCH_ROWS or not has_next_page:
+                    batch_issues = save_issues_to_db(
+                        conn,
+                        pending_issues,
+                        f"{owner}/{repo}",
+                        replace=use_incremental,
+                        **pending_progress,
+                    )
+                    pending_issues.clear()
+                else:
+                    batch_issues = 0
 
                 if batch_issues > 0:
                     progress_bar.update(
@@ -1104,6 +1255,14 @@ def fetch_all_issues(
                         description=f"Fetching Issues (last: #{last_issue}, new: "
                         f"{batch_issues})",
                     )
+                elif pending_issues:
+                    progress_bar.update(
+                        task,
+                        description=(
+                            f"Fetching Issues (last: #{last_issue}, "
+                            f"buffered: {len(pending_issues)})"
+                        ),
+                    )
                 else:
                     progress_bar.update(
                         task,
@@ -1113,35 +1272,48 @@ def fetch_all_issues(
                     )
 
                 # Check if we have more pages
-                if not issues_data["pageInfo"]["hasNextPage"]:
+                if not has_next_page:
                     break
 
                 cursor = issues_data["pageInfo"]["endCursor"]
 
-                # Rate limiting
-                time.sleep(0.2)  # Slightly longer delay
-
             except Exception as e:
                 console.print(
                     f"[red]Error fetching issue batch (cursor: {cursor}): {e}[/red]"
                 )
                 console.print("[yellow]Waiting 10 seconds before retrying...[/yellow]")
                 time.sleep(10)
-                # Continue with same cursor to retry
+                # Large pages are the usual cause of timeouts and 502s, so retry
+                # the same cursor with a smaller page
+                batch_size = max(MIN_PAGE_SIZE, batch_size // 2)
+
+        # Write whatever is still buffered when the loop stops early
+        if pending_issues:
+            batch_issues = save_issues_to_db(
+                conn,
+                pending_issues,
+                f"{owner}/{repo}",
+                replace=use_incremental,
+                **pending_progress,
+            )
+            progress_bar.update(task, advance=batch_issues)
 
 
 def reset_database(conn: sqlite3.Connection, repo_name: str):
     """Reset the database for a fresh start."""
-    cursor = conn.cursor()
-
     console.print(f"[yellow]Resetting database for {repo_name}...[/yellow]")
 
-    # Clear all data
-    cursor.execute("DELETE FROM pull_requests")
-    cursor.execute("DELETE FROM issues")
-    cursor.execute("DELETE FROM sync_progress WHERE repo_name = ?", (repo_name,))
-
-    conn.commit()
+    # Clear all data in one transaction
+    with conn:
+        conn.execute("DELETE FROM pull_requests")
+        conn.execute("DELETE FROM issues")
+        for prefix, columns in LINKED_COLUMNS.values():
+            for column in columns:
+                conn.execute(f"DELETE FROM {prefix}_{column}")
+        conn.execute("DELETE FROM sync_progress WHERE repo_name = ?", (repo_name,))
+
+    # Truncate the WAL now that most of its pages are dead
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     console.print("[green]Database reset complete![/green]")
 
 
@@ -1206,9 +1378,10 @@ def main():
             reset_database(conn, repo_name)
 
         # Update totals in progress tracking
-        update_sync_progress(
-            conn, repo_name, total_prs=total_prs, total_issues=total_issues
-        )
+        with conn:
+            update_sync_progress(
+                conn, repo_name, total_prs=total_prs, total_issues=total_issues
+            )
 
         # Fetch all PRs
         if not args.skip_prs and not shutdown_requested:
@@ -1225,9 +1398,10 @@ def main():
             console.print("[dim]Skipping issues as requested[/dim]")
 
         # Update final sync time
-        update_sync_progress(
-            conn, repo_name, last_sync_at=datetime.now(timezone.utc).isoformat()
-        )
+        with conn:
+            update_sync_progress(
+                conn, repo_name, last_sync_at=datetime.now(timezone.utc).isoformat()
+            )
 
         if shutdown_requested:
             console.print(
@@ -1253,10 +1427,7 @@ def main():
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM pull_requests")
         pr_count = cursor.fetchone()[0]
-        cursor.execute(
-            "SELECT COUNT(*) FROM issues WHERE number NOT IN (SELECT number FROM "
-            "pull_requests)"
-        )
+        cursor.execute(ISSUE_COUNT_SQL)
         issue_count = cursor.fetchone()[0]
 
         console.print(f"[green]Stored {pr_count} PRs and {issue_count} issues[/green]")
@@ -1266,6 +1437,8 @@ def main():
         raise
     finally:
         if "conn" in locals():
+            # Fold the WAL back into the database so it doesn't linger on disk
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             conn.close()
 
 
@@ -4,8 +4,9 @@ import json
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
+import orjson
 import polars as pl
 from dotenv import load_dotenv
 from github import Github
@@ -43,24 +44,28 @@ def get_cache_path(repo_name: str, data_type: str) -> Path:
     return CACHE_DIR / f"{repo_name.replace('/', '_')}_{data_type}.parquet"
 
 
-def get_raw_cache_path(repo_name: str, data_type: str, item_id: int) -> Path:
-    """Get the raw cache file path for a specific item."""
-    return RAW_CACHE_DIR / f"{repo_name.replace('/', '_')}_{data_type}_{item_id}.json"
+def get_raw_cache_path(repo_name: str, data_type: str) -> Path:
+    """Get the raw NDJSON cache file path for a repository and data type."""
+    return RAW_CACHE_DIR / f"{repo_name.replace('/', '_')}_{data_type}.ndjson"
 
 
-def save_raw_item(item: Any, repo_name: str, data_type: str, item_id: int) -> None:
-    """Save raw item data to JSON file."""
-    cache_path = get_raw_cache_path(repo_name, data_type, item_id)
-    # Convert the GitHub object to a dictionary
-    data = dict(item.raw_data)
-    with open(cache_path, "w") as f:
-        json.dump(data, f)
+def save_raw_item(item: Any, raw_file: BinaryIO) -> None:
+    """Append raw item data as one JSON line to an open NDJSON file.
 
+    Items fetched again on a later run are appended again; the last line for a
+    given number is the most recent one.
+    """
+    raw_file.write(orjson.dumps(item.raw_data, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def load_cached_data(cache_path: Path) -> Optional[pl.LazyFrame]:
+    """Lazily scan cached data if it exists.
 
-def load_cached_data(cache_path: Path) -> Optional[pl.DataFrame]:
-    """Load cached data if it exists."""
+    Nothing is read until the frame is collected, so runs without new items
+    never decode the cache.
+    """
     if cache_path.exists():
-        return pl.read_parquet(cache_path)
+        return pl.scan_parquet(cache_path)
     return None
 
 
@@ -69,6 +74,16 @@ def save_to_cache(df: pl.DataFrame, cache_path: Path) -> None:
     df.write_parquet(cache_path)
 
 
+def merge_with_cache(cached: pl.LazyFrame, new_df: pl.DataFrame) -> pl.DataFrame:
+    """Merge freshly fetched rows into cached ones, keeping the fresh version.
+
+    An anti-join drops the cached rows that were fetched again, so the result
+    needs no deduplication pass over the whole union.
+    """
+    kept = cached.join(new_df.lazy().select("number"), on="number", how="anti")
+    return pl.concat([kept, new_df.lazy()]).collect()
+
+
 def get_github_client() -> Github:
     """Initialize and return GitHub client using token from environment."""
     token = os.getenv("GITHUB_TOKEN")
@@ -107,7 +122,7 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
     start_date, end_date = get_week_bounds()
     console.print(f"Fetching data from {start_date} to {end_date}")
 
-    # Load cached data
+    # Scan cached data; it is only read if there is something to merge
     cached_issues = load_cached_data(issues_cache)
     cached_prs = load_cached_data(prs_cache)
 
@@ -119,12 +134,16 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
             raise ValueError(f"Repository {repo_name} not found") from e
         raise
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
+    with (
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress,
+        open(get_raw_cache_path(repo_name, "issue"), "ab") as raw_issues,
+        open(get_raw_cache_path(repo_name, "pr"), "ab") as raw_prs,
+    ):
         # Fetch new issues
         new_issues = []
         issue_task = progress.add_task("Fetching closed issues...", total=None)
@@ -132,7 +151,7 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
             for issue in repo.get_issues(state="closed", since=start_date):
                 if not issue.pull_request:  # Skip PRs
                     # Save raw data immediately
-                    save_raw_item(issue, repo_name, "issue", issue.number)
+                    save_raw_item(issue, raw_issues)
                     new_issues.append(
                         {
                             "number": issue.number,
@@ -151,12 +170,6 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
                         description=f"Fetched issue #{issue.number}",
                     )
 
-                    # Save to DataFrame periodically (every 10 items)
-                    if len(new_issues) % 10 == 0:
-                        temp_df = pl.DataFrame(new_issues)
-                        if not temp_df.is_empty():
-                            save_to_cache(temp_df, issues_cache)
-
         except GithubException as e:
             console.print(f"[yellow]Warning: Error fetching issues: {e}[/yellow]")
         finally:
@@ -166,17 +179,17 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
         new_prs = []
         pr_task = progress.add_task("Fetching merged pull requests...", total=None)
         try:
-            for pr in repo.get_pulls(
-                state="closed",
-                sort="updated",
-                direction="desc",
-            ):
+            # Let the search API select the merged PRs instead of paging
+            # through every closed PR of the repository
+            query = f"repo:{repo_name} is:pr is:merged merged:>={start_date:%Y-%m-%d}"
+            for result in g.search_issues(query, sort="updated", order="desc"):
+                pr = result.as_pull_request()
                 # Only process PRs that were merged in our time window
                 if not (pr.merged and pr.merged_at and pr.merged_at >= start_date):
                     continue
 
                 # Save raw data immediately
-                save_raw_item(pr, repo_name, "pr", pr.number)
+                save_raw_item(pr, raw_prs)
                 new_prs.append(
                     {
                         "number": pr.number,
@@ -195,17 +208,6 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
                     description=f"Fetched PR #{pr.number}",
                 )
 
-                # Save to DataFrame periodically (every 10 items)
-                if len(new_prs) % 10 == 0:
-                    temp_df = pl.DataFrame(new_prs)
-                    if not temp_df.is_empty():
-                        save_to_cache(temp_df, prs_cache)
-
-                # If this PR was merged before our start date, we can stop
-                # as PRs are sorted by updated date descending
-                if pr.merged_at < start_date:
-                    break
-
         except GithubException as e:
             console.print(
                 f"[yellow]Warning: Error fetching pull requests: {e}[/yellow]"
@@ -219,10 +221,10 @@ def fetch_issues_and_prs(repo_name: str) -> tuple[pl.DataFrame, pl.DataFrame]:
 
     # Merge with cache if exists
     if cached_issues is not None and not issues_df.is_empty():
-        issues_df = pl.concat([cached_issues, issues_df]).unique(subset=["number"])
+        issues_df = merge_with_cache(cached_issues, issues_df)
 
     if cached_prs is not None and not prs_df.is_empty():
-        prs_df = pl.concat([cached_prs, prs_df]).unique(subset=["number"])
+        prs_df = merge_with_cache(cached_prs, prs_df)
 
     # Save final data to cache
     if not issues_df.is_empty():
@@ -6,16 +6,20 @@ text summaries. Provides graceful fallback when Ollama is unavailable.
 
 from __future__ import annotations
 
+import orjson
 import requests
 
 OLLAMA_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.1:8b"
 
+# Shared session so repeated summary requests reuse one keep-alive connection
+_session = requests.Session()
+
 
 def is_ollama_available() -> bool:
     """Check if Ollama is running and accessible."""
     try:
-        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=2)
+        response = _session.get(f"{OLLAMA_URL}/api/tags", timeout=2)
         return response.status_code == 200
     except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         return False
@@ -24,11 +28,11 @@ def is_ollama_available() -> bool:
 def list_models() -> list[str]:
     """List available models in Ollama."""
     try:
-        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
+        response = _session.get(f"{OLLAMA_URL}/api/tags", timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return [model["name"] for model in data.get("models", [])]
-    except (requests.exceptions.RequestException, KeyError):
+    except (requests.exceptions.RequestException, KeyError, ValueError):
         return []
 
 
@@ -54,7 +58,7 @@ def generate_summary(
         The generated response, or an error message if generation fails.
     """
     try:
-        response = requests.post(
+        response = _session.post(
             f"{OLLAMA_URL}/api/generate",
             json={
                 "model": model,
@@ -68,7 +72,7 @@ def generate_summary(
             timeout=timeout,
         )
         response.raise_for_status()
-        return response.json().get("response", "").strip()
+        return orjson.loads(response.content).get("response", "").strip()
     except requests.exceptions.Timeout:
         return "[LLM timeout]"
     except requests.exceptions.ConnectionError:
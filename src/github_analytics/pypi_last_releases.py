@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 PROJECTS = [
     "scikit-learn",
@@ -16,17 +20,59 @@ PROJECTS = [
 ]
 
 PYPI_URL_TEMPLATE = "https://pypi.org/pypi/{project}/json"
+PYPI_SIMPLE_URL_TEMPLATE = "https://pypi.org/simple/{project}/"
+PYPI_SIMPLE_ACCEPT = "application/vnd.pypi.simple.v1+json"
+SDIST_SUFFIXES = (".tar.gz", ".tar.bz2", ".tgz", ".zip")
 
+# One keep-alive session so every project reuses the same TLS connection
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5), pool_maxsize=10),
+)
 
-def get_last_releases(project: str, n: int = 3) -> list[tuple[str, str]]:
-    """Fetch the last n releases for a PyPI project,
-    returning (version, date) tuples."""
+
+def version_from_filename(filename: str) -> str | None:
+    """Extract the version from a wheel, egg or sdist filename."""
+    if filename.endswith((".whl", ".egg")):
+        # Wheel and egg names escape "-" in the project name, so the version is
+        # always the second field
+        return filename.split("-")[1]
+    for suffix in SDIST_SUFFIXES:
+        if filename.endswith(suffix):
+            name_version = filename.removesuffix(suffix)
+            # Versions never contain "-", so it is after the last one
+            return name_version.rsplit("-", 1)[-1] if "-" in name_version else None
+    return None
+
+
+def get_release_times_simple(project: str) -> dict[str, str]:
+    """Map each version to its latest upload time using the PEP 691 index.
+
+    The simple index only lists files, so it is much smaller than the full JSON
+    API response, which also carries every release's metadata.
+    """
+    url = PYPI_SIMPLE_URL_TEMPLATE.format(project=project)
+    resp = _session.get(url, headers={"Accept": PYPI_SIMPLE_ACCEPT}, timeout=10)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    release_times: dict[str, str] = {}
+    for f in data["files"]:
+        version = version_from_filename(f["filename"])
+        upload_time = f["upload-time"]
+        if version and upload_time > release_times.get(version, ""):
+            release_times[version] = upload_time
+    return release_times
+
+
+def get_release_times_json(project: str) -> dict[str, str]:
+    """Map each version to its latest upload time using the JSON API."""
     url = PYPI_URL_TEMPLATE.format(project=project)
-    resp = requests.get(url)
+    resp = _session.get(url, timeout=10)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     releases = data.get("releases", {})
-    version_dates = []
+    release_times = {}
     for version, files in releases.items():
         # Use the latest upload time among files for this version
         if not files:
@@ -40,17 +86,32 @@ def get_last_releases(project: str, n: int = 3) -> list[tuple[str, str]]:
             default=None,
         )
         if latest_time:
-            version_dates.append((version, latest_time))
+            release_times[version] = latest_time
+    return release_times
+
+
+def get_last_releases(project: str, n: int = 3) -> list[tuple[str, str]]:
+    """Fetch the last n releases for a PyPI project,
+    returning (version, date) tuples."""
+    try:
+        release_times = get_release_times_simple(project)
+    except (requests.exceptions.RequestException, KeyError, ValueError):
+        # Fall back to the full JSON API if the simple index can't be used
+        release_times = get_release_times_json(project)
     # Sort by upload time descending
-    version_dates.sort(key=lambda x: x[1], reverse=True)
+    version_dates = sorted(release_times.items(), key=lambda x: x[1], reverse=True)
     return version_dates[:n]
 
 
 def main():
-    for project in PROJECTS:
+    # Fetch all projects concurrently, then print them in PROJECTS order
+    with ThreadPoolExecutor(max_workers=min(8, len(PROJECTS))) as executor:
+        futures = [executor.submit(get_last_releases, p, 3) for p in PROJECTS]
+
+    for project, future in zip(PROJECTS, futures):
         print(f"\nProject: {project}")
         try:
-            last_releases = get_last_releases(project, 3)
+            last_releases = future.result()
             for version, date in last_releases:
                 dt = datetime.fromisoformat(date.replace("Z", "+00:00"))
                 # print(f"  Version: {version}  Date: {dt:%Y-%m-%d %H:%M:%S %Z}")
@@ -2,8 +2,14 @@
 
 import argparse
 import os
+import time
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
 
+import orjson
+import polars as pl
+import requests
 from dotenv import load_dotenv
 from github import Github
 from rich.console import Console
@@ -29,6 +35,31 @@ REPOS = [
     "scikit-learn-contrib/imbalanced-learn",
 ]
 
+# Search qualifiers for each statistic, issue searches exclude PRs
+STAT_QUERIES = {
+    "created_prs": "is:pr created:>={date}",
+    "closed_prs": "is:pr closed:>={date}",
+    "updated_prs": "is:pr updated:>={date}",
+    "created_issues": "is:issue -is:pr created:>={date}",
+    "closed_issues": "is:issue -is:pr closed:>={date}",
+    "updated_issues": "is:issue -is:pr updated:>={date}",
+}
+
+# Aliased searches per GraphQL request, well below GitHub's node limits
+SEARCHES_PER_REQUEST = 30
+
+# Attempts per request when GitHub answers with a secondary rate limit
+SEARCH_RETRIES = 3
+
+# Stop issuing requests if fewer GraphQL points than this remain
+RATE_LIMIT_THRESHOLD = 100
+
+# Search counts fetched within this window are reused instead of re-queried
+CACHE_DIR = Path("cache")
+CACHE_DIR.mkdir(exist_ok=True)
+STATS_CACHE_PATH = CACHE_DIR / "quick_stats.parquet"
+STATS_CACHE_TTL = timedelta(minutes=10)
+
 
 def get_date_bounds(start_date: str | None = None) -> tuple[datetime, datetime]:
     """Get the start and end dates for the analysis period.
@@ -71,50 +102,143 @@ def get_github_client() -> Github:
         raise ValueError("Invalid GitHub token. Please check your token.") from e
 
 
-def get_repo_stats(g: Github, repo_name: str, start_date: datetime) -> dict:
-    """Get PR and issue statistics for a repository."""
-    stats = {
-        "name": repo_name,
-        "created_prs": 0,
-        "closed_prs": 0,
-        "updated_prs": 0,
-        "created_issues": 0,
-        "closed_issues": 0,
-        "updated_issues": 0,
+def build_stats_query(num_queries: int) -> str:
+    """Build a GraphQL document with one aliased ``search`` per query variable.
+
+    Only ``issueCount`` is selected, so each alias is a single count.
+    """
+    params = ", ".join(f"$q{i}: String!" for i in range(num_queries))
+    searches = "\n".join(
+        f"  s{i}: search(query: $q{i}, type: ISSUE) {{ issueCount }}"
+        for i in range(num_queries)
+    )
+    return f"""
+query({params}) {{
+  rateLimit {{
+    cost
+    remaining
+  }}
+{searches}
+}}
+"""
+
+
+def graphql_search_counts(queries: list[str]) -> dict[str, Any]:
+    """Run several search queries in one GraphQL request, returning the data."""
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        raise RuntimeError("GITHUB_TOKEN not found for GraphQL request")
+
+    payload = {
+        "query": build_stats_query(len(queries)),
+        "variables": {f"q{i}": query for i, query in enumerate(queries)},
     }
+    headers = {"Authorization": f"bearer {token}"}
+    for attempt in range(SEARCH_RETRIES):
+        response = requests.post(
+            "https://api.github.com/graphql",
+            json=payload,
+            headers=headers,
+            timeout=30,
+        )
+        # Secondary rate limits come back as 403/429 with a Retry-After header
+        if response.status_code in (403, 429) and attempt < SEARCH_RETRIES - 1:
+            time.sleep(int(response.headers.get("Retry-After", 60)))
+            continue
+        response.raise_for_status()
+        break
+    result: dict[str, Any] = orjson.loads(response.content)
+    if "errors" in result:
+        raise RuntimeError(f"GraphQL errors: {result['errors']}")
+    return result["data"]
+
+
+def load_stats_cache(path: Path, now: datetime) -> pl.DataFrame:
+    """Load cached search counts that are still within ``STATS_CACHE_TTL``."""
+    if path.exists():
+        return pl.read_parquet(path).filter(
+            pl.col("fetched_at") >= now - STATS_CACHE_TTL
+        )
+    return pl.DataFrame(
+        schema={
+            "query": pl.Utf8,
+            "count": pl.Int64,
+            "fetched_at": pl.Datetime("us", "UTC"),
+        }
+    )
 
+
+def save_stats_cache(df: pl.DataFrame, path: Path) -> None:
+    """Save search counts to the cache."""
+    if not df.is_empty():
+        df.write_parquet(path)
+
+
+def get_repo_stats(repos: list[str], start_date: datetime) -> list[dict]:
+    """Get PR and issue statistics for several repositories.
+
+    All searches are sent as aliases of a few GraphQL requests, up to
+    ``SEARCHES_PER_REQUEST`` each, instead of one REST search per statistic.
+    Counts fetched within ``STATS_CACHE_TTL`` are read from the cache instead.
+    """
     # Format date for GitHub search
     date_str = start_date.strftime("%Y-%m-%d")
 
-    try:
-        # Get PR stats
-        created_prs = g.search_issues(f"repo:{repo_name} is:pr created:>={date_str}")
-        closed_prs = g.search_issues(f"repo:{repo_name} is:pr closed:>={date_str}")
-        updated_prs = g.search_issues(f"repo:{repo_name} is:pr updated:>={date_str}")
-        stats["created_prs"] = created_prs.totalCount
-        stats["closed_prs"] = closed_prs.totalCount
-        stats["updated_prs"] = updated_prs.totalCount
-
-        # Get issue stats (excluding PRs)
-        created_issues = g.search_issues(
-            f"repo:{repo_name} is:issue -is:pr created:>={date_str}"
-        )
-        closed_issues = g.search_issues(
-            f"repo:{repo_name} is:issue -is:pr closed:>={date_str}"
-        )
-        updated_issues = g.search_issues(
-            f"repo:{repo_name} is:issue -is:pr updated:>={date_str}"
-        )
-        stats["created_issues"] = created_issues.totalCount
-        stats["closed_issues"] = closed_issues.totalCount
-        stats["updated_issues"] = updated_issues.totalCount
+    stats_list = [
+        {"name": repo_name, **dict.fromkeys(STAT_QUERIES, 0)} for repo_name in repos
+    ]
+    searches = [
+        (stats, key, f"repo:{stats['name']} {query.format(date=date_str)}")
+        for stats in stats_list
+        for key, query in STAT_QUERIES.items()
+    ]
 
-    except Exception as e:
-        console.print(
-            f"[yellow]Warning: Error fetching stats for {repo_name}: {e}[/yellow]"
+    # The search string includes the repo and start date, so it is the cache key
+    now = datetime.now(timezone.utc)
+    cache = load_stats_cache(STATS_CACHE_PATH, now)
+    cached_counts = dict(zip(cache["query"], cache["count"]))
+    for stats, key, query in searches:
+        if query in cached_counts:
+            stats[key] = cached_counts[query]
+    searches = [search for search in searches if search[2] not in cached_counts]
+    fetched = []
+
+    for start in range(0, len(searches), SEARCHES_PER_REQUEST):
+        batch = searches[start : start + SEARCHES_PER_REQUEST]
+        try:
+            data = graphql_search_counts([query for _, _, query in batch])
+        except Exception as e:
+            names = sorted({stats["name"] for stats, _, _ in batch})
+            console.print(
+                f"[yellow]Warning: Error fetching stats for {', '.join(names)}: "
+                f"{e}[/yellow]"
+            )
+            continue
+
+        for i, (stats, key, query) in enumerate(batch):
+            stats[key] = data[f"s{i}"]["issueCount"]
+            fetched.append((query, stats[key]))
+
+        rate_remaining = data["rateLimit"]["remaining"]
+        if rate_remaining < RATE_LIMIT_THRESHOLD:
+            console.print(
+                f"[yellow]Rate-limit low ({rate_remaining}). Skipping the remaining "
+                "searches.[/yellow]"
+            )
+            break
+
+    if fetched:
+        fetched_df = pl.DataFrame(
+            {
+                "query": [query for query, _ in fetched],
+                "count": [count for _, count in fetched],
+                "fetched_at": [now] * len(fetched),
+            },
+            schema=cache.schema,
         )
+        save_stats_cache(pl.concat([cache, fetched_df]), STATS_CACHE_PATH)
 
-    return stats
+    return stats_list
 
 
 def display_stats(stats_list: list[dict]) -> None:
@@ -152,7 +276,8 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        g = get_github_client()
+        # Fail early on a missing or invalid token
+        get_github_client()
         start_date, end_date = get_date_bounds(args.start)
 
         console.print(
@@ -161,11 +286,8 @@ def main() -> None:
         )
 
         # Get stats for all repositories
-        stats_list = []
-        for repo in REPOS:
-            console.print(f"Fetching stats for {repo}...")
-            stats = get_repo_stats(g, repo, start_date)
-            stats_list.append(stats)
+        console.print(f"Fetching stats for {len(REPOS)} repositories...")
+        stats_list = get_repo_stats(REPOS, start_date)
 
         # Display results
         display_stats(stats_list)
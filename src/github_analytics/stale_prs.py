@@ -19,10 +19,11 @@ Key implementation decisions
   HTTP calls compared to REST-timeline endpoints.  Each page returns the last
   20 reviews, comments and commits for every PR, which is usually enough to
   capture the relevant recent activity for staleness analysis.
-* **Incremental CSV cache** under ``cache/stale_prs_<repo>.csv`` - after each
-  GraphQL page the file is re-written so the script can be stopped and
-  restarted later.  PRs whose ``updated_at`` value hasn't changed are skipped
-  (no API cost).
+* **Incremental CSV cache** under ``cache/stale_prs_<repo>.csv`` - each GraphQL
+  page is appended as its own parquet file, and the pages are merged into the
+  CSV once at the end (or at the start of the next run if the script was
+  stopped).  PRs whose ``updated_at`` value hasn't changed are skipped (no API
+  cost).
 * **Rate-limit guard** - after every GraphQL call we consult the ``rateLimit``
   object and stop early (saving progress) if the remaining points drop below a
   safety threshold (default 100).
@@ -42,6 +43,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import polars as pl
 import requests
 from dotenv import load_dotenv
@@ -97,6 +99,16 @@ def cache_path(repo: str) -> Path:
     return CACHE_DIR / f"stale_prs_{sanitized}.csv"
 
 
+def page_path(repo: str, page: int) -> Path:
+    sanitized = repo.replace("/", "_")
+    return CACHE_DIR / f"stale_prs_{sanitized}_page{page:05d}.parquet"
+
+
+def page_paths(repo: str) -> list[Path]:
+    sanitized = repo.replace("/", "_")
+    return sorted(CACHE_DIR.glob(f"stale_prs_{sanitized}_page*.parquet"))
+
+
 def load_cache(path: Path) -> pl.DataFrame:
     if path.exists():
         return pl.read_csv(path, try_parse_dates=True)
@@ -108,6 +120,33 @@ def save_cache(df: pl.DataFrame, path: Path) -> None:
         df.write_csv(path)
 
 
+def merge_pages(repo: str, path: Path) -> pl.DataFrame:
+    """Fold the per-page parquet files into the CSV cache and delete them.
+
+    Pages are appended in fetch order after the existing cache, so keeping the
+    last row per PR number keeps the most recent one.
+    """
+    existing_df = load_cache(path)
+    pages = page_paths(repo)
+    if not pages:
+        return existing_df
+
+    frames = [pl.scan_parquet(page) for page in pages]
+    if not existing_df.is_empty():
+        frames.insert(0, existing_df.lazy())
+    # All-null columns are stored as Null, so let concat widen them
+    combined = (
+        pl.concat(frames, how="vertical_relaxed")
+        .unique(subset=["number"], keep="last")
+        .sort("number")
+        .collect()
+    )
+    save_cache(combined, path)
+    for page in pages:
+        page.unlink()
+    return combined
+
+
 # ---------------------------------------------------------------------------
 # GraphQL query helpers
 # ---------------------------------------------------------------------------
@@ -171,7 +210,7 @@ def graphql_page(owner: str, name: str, after: str | None) -> dict[str, Any]:
         timeout=30,
     )
     response.raise_for_status()
-    result: dict[str, Any] = response.json()
+    result: dict[str, Any] = orjson.loads(response.content)
     if "errors" in result:
         raise RuntimeError(f"GraphQL errors: {result['errors']}")
     return result["data"]
@@ -189,54 +228,56 @@ def parse_datetime(ts: str | None) -> datetime | None:
 
 
 def collect_activity(
-    pr_node: dict[str, Any],
-) -> tuple[datetime | None, datetime | None, datetime | None]:
-    """Return (author_last, others_last, last_review)."""
-    author_login = pr_node.get("author", {}).get("login")
-
-    author_last: datetime | None = None
-    others_last: datetime | None = None
-
-    # Comments
-    for cm in pr_node["comments"]["nodes"]:
-        ts = parse_datetime(cm["createdAt"])
-        if not ts:
-            continue
-        cm_author = cm.get("author", {}) or {}
-        cm_login = cm_author.get("login")
-        if cm_login == author_login:
-            author_last = max(author_last or ts, ts)
-        else:
-            others_last = max(others_last or ts, ts)
-
-    # Reviews
-    last_review: datetime | None = None
-    for rv in pr_node["reviews"]["nodes"]:
-        ts = parse_datetime(rv["submittedAt"])
-        if not ts:
-            continue
-        last_review = max(last_review or ts, ts)
-        rv_author = rv.get("author", {}) or {}
-        rv_login = rv_author.get("login")
-        if rv_login == author_login:
-            author_last = max(author_last or ts, ts)
-        else:
-            others_last = max(others_last or ts, ts)
-
-    # Commits
-    for cm in pr_node["commits"]["nodes"]:
-        commit = cm["commit"]
-        ts = parse_datetime(commit["committedDate"])
-        if not ts:
-            continue
-        commit_author = (commit.get("author", {}) or {}).get("user", {})
-        login = commit_author.get("login") if isinstance(commit_author, dict) else None
-        if login == author_login:
-            author_last = max(author_last or ts, ts)
-        else:
-            others_last = max(others_last or ts, ts)
-
-    return author_last, others_last, last_review
+    pr_nodes: list[dict[str, Any]],
+) -> dict[int, tuple[datetime | None, datetime | None, datetime | None]]:
+    """Return {number: (author_last, others_last, last_review)} for a page of PRs.
+
+    Comments, reviews and commits are flattened into one event frame so the
+    latest timestamps for every PR come out of a single group-by.
+    """
+    events = []
+    for pr in pr_nodes:
+        number = pr["number"]
+        author_login = (pr.get("author") or {}).get("login")
+        for cm in pr["comments"]["nodes"]:
+            login = (cm.get("author") or {}).get("login")
+            events.append((number, author_login, login, cm["createdAt"], "comment"))
+        for rv in pr["reviews"]["nodes"]:
+            login = (rv.get("author") or {}).get("login")
+            events.append((number, author_login, login, rv["submittedAt"], "review"))
+        for cm in pr["commits"]["nodes"]:
+            commit = cm["commit"]
+            login = ((commit.get("author") or {}).get("user") or {}).get("login")
+            events.append(
+                (number, author_login, login, commit["committedDate"], "commit")
+            )
+
+    df = pl.DataFrame(
+        events,
+        schema={
+            "number": pl.Int64,
+            "pr_author": pl.Utf8,
+            "event_author": pl.Utf8,
+            "ts": pl.Utf8,
+            "kind": pl.Utf8,
+        },
+        orient="row",
+    )
+    # Missing logins compare equal, e.g. a ghost author's own comments
+    by_author = pl.col("event_author").eq_missing(pl.col("pr_author"))
+    activity = (
+        df.with_columns(
+            pl.col("ts").str.to_datetime("%Y-%m-%dT%H:%M:%SZ", time_zone="UTC")
+        )
+        .drop_nulls("ts")
+        .group_by("number")
+        .agg(
+            pl.col("ts").filter(by_author).max().alias("author_last"),
+            pl.col("ts").filter(~by_author).max().alias("others_last"),
+            pl.col("ts").filter(pl.col("kind") == "review").max().alias("last_review"),
+        )
+    )
+    return {row[0]: row[1:] for row in activity.iter_rows()}
 
 
 # ---------------------------------------------------------------------------
@@ -247,7 +288,8 @@ def collect_activity(
 def process_repository(repo: str, out_csv: Path) -> None:
     owner, name = split_repo(repo)
 
-    existing_df = load_cache(out_csv)
+    # Pages left behind by an interrupted run are merged before we start
+    existing_df = merge_pages(repo, out_csv)
     existing_dict = (
         existing_df.select(["number", "updated_at"]).to_dict(as_series=False)
         if not existing_df.is_empty()
@@ -267,6 +309,7 @@ def process_repository(repo: str, out_csv: Path) -> None:
     ) as progress:
         page_task = progress.add_task("Querying pull requests...", total=None)
         after: str | None = None
+        page = 0
         while True:
             data = graphql_page(owner, name, after)
 
@@ -281,14 +324,19 @@ def process_repository(repo: str, out_csv: Path) -> None:
             if not pr_nodes:
                 break
 
-            for pr in pr_nodes:
-                number = pr["number"]
-                updated_at = pr["updatedAt"]
-                # Skip if unchanged since last run
-                if cache_updated_at.get(number) == updated_at:
-                    continue
+            # Skip if unchanged since last run
+            changed = [
+                pr
+                for pr in pr_nodes
+                if cache_updated_at.get(pr["number"]) != parse_datetime(pr["updatedAt"])
+            ]
+            activity = collect_activity(changed) if changed else {}
 
-                author_last, others_last, last_review = collect_activity(pr)
+            for pr in changed:
+                number = pr["number"]
+                author_last, others_last, last_review = activity.get(
+                    number, (None, None, None)
+                )
                 row = {
                     "number": number,
                     "url": pr["url"],
@@ -301,26 +349,14 @@ def process_repository(repo: str, out_csv: Path) -> None:
                         if author_last and others_last
                         else None
                     ),
-                    "updated_at": updated_at,
+                    "updated_at": parse_datetime(pr["updatedAt"]),
                 }
                 new_rows.append(row)
 
-            # Merge & save after each page
+            # Append this page to its own file; everything is merged at the end
             if new_rows:
-                new_df = pl.DataFrame(new_rows)
-                combined = (
-                    pl.concat([existing_df, new_df])
-                    if not existing_df.is_empty()
-                    else new_df
-                )
-                # keep latest row per PR number (updated_at desc implicit in ordering)
-                combined = (
-                    combined.sort("updated_at", descending=True)
-                    .unique(subset=["number"], keep="first")
-                    .sort("number")
-                )
-                save_cache(combined, out_csv)
-                existing_df = combined
+                pl.DataFrame(new_rows).write_parquet(page_path(repo, page))
+                page += 1
                 new_rows = []
 
             page_info = data["repository"]["pullRequests"]["pageInfo"]
@@ -330,6 +366,8 @@ def process_repository(repo: str, out_csv: Path) -> None:
 
         progress.update(page_task, description="Finished querying pull requests")
 
+    existing_df = merge_pages(repo, out_csv)
+
     # Pretty print summary table
     if existing_df.is_empty():
         console.print("[yellow]No pull requests processed.[/yellow]")
@@ -31,6 +31,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import polars as pl
 import requests
 from dotenv import load_dotenv
@@ -319,7 +320,7 @@ def graphql_request(
                 timeout=60,  # Increased timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             if "errors" in result:
                 raise RuntimeError(f"GraphQL errors: {result['errors']}")
             return result["data"]